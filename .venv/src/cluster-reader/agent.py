@@ -0,0 +1,271 @@
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+from dataclasses import asdict, dataclass
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from kubeyug import profiling
+from kubeyug.kube import node_capabilities
+
+NAMESPACE = "kubeyug"
+CAPS_LABEL_SELECTOR = "app=kubeyug-node-capabilities"
+CM_PREFIX = "kubeyug-node-"
+HASH_ANNOTATION = "kubeyug.io/capabilities-hash"
+
+WATCH_TIMEOUT_SECONDS = int(os.getenv("KUBEYUG_AGENT_WATCH_TIMEOUT_SECONDS", "300"))
+BACKOFF_MAX_SECONDS = float(os.getenv("KUBEYUG_AGENT_BACKOFF_MAX_SECONDS", "60"))
+
+_CORE_V1: client.CoreV1Api | None = None
+
+
+def _core_v1() -> client.CoreV1Api:
+    # One client per process; loading kubeconfig is not free and the agent may run for days.
+    global _CORE_V1
+    if _CORE_V1 is None:
+        try:
+            config.load_kube_config()
+        except config.ConfigException:
+            config.load_incluster_config()
+        _CORE_V1 = profiling.instrument(client.CoreV1Api())
+    return _CORE_V1
+
+
+def get_node_name():
+    return os.environ.get("KUBEYUG_NODE_NAME")
+
+
+def capabilities_hash(caps: dict) -> str:
+    blob = json.dumps(caps, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_cluster_capabilities():
+    v1 = _core_v1()
+    return {node.metadata.name: node_capabilities(node) for node in v1.list_node().items}
+
+
+def ensure_namespace():
+    v1 = _core_v1()
+
+    ns_body = client.V1Namespace(
+        metadata=client.V1ObjectMeta(name=NAMESPACE)
+    )
+
+    try:
+        v1.create_namespace(ns_body)
+        print(f"Created namespace {NAMESPACE}")
+    except ApiException as e:
+        if e.status == 409:
+            print(f"Namespace {NAMESPACE} already exists")
+        else:
+            raise
+
+
+def _configmap_body(cm_name: str, caps: dict, caps_hash: str) -> client.V1ConfigMap:
+    return client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
+        metadata=client.V1ObjectMeta(
+            name=cm_name,
+            namespace=NAMESPACE,
+            labels={"app": "kubeyug-node-capabilities"},
+            annotations={HASH_ANNOTATION: caps_hash},
+        ),
+        data={"capabilities.json": json.dumps(caps, indent=2)},
+    )
+
+
+def upsert_configmap_for_node(node_name: str, caps: dict, caps_hash: str | None = None):
+    """
+    Patch the node's ConfigMap in place; create it only if it does not exist yet.
+    """
+    v1 = _core_v1()
+    cm_name = f"{CM_PREFIX}{node_name}"
+    body = _configmap_body(cm_name, caps, caps_hash or capabilities_hash(caps))
+
+    try:
+        v1.patch_namespaced_config_map(name=cm_name, namespace=NAMESPACE, body=body)
+        print(f"Updated ConfigMap {cm_name} in {NAMESPACE}")
+    except ApiException as e:
+        if e.status != 404:
+            raise
+        v1.create_namespaced_config_map(namespace=NAMESPACE, body=body)
+        print(f"Created ConfigMap {cm_name} in {NAMESPACE}")
+
+
+def delete_configmap_for_node(node_name: str) -> bool:
+    v1 = _core_v1()
+    cm_name = f"{CM_PREFIX}{node_name}"
+    try:
+        v1.delete_namespaced_config_map(name=cm_name, namespace=NAMESPACE)
+        print(f"Deleted ConfigMap {cm_name} in {NAMESPACE}")
+        return True
+    except ApiException as e:
+        if e.status == 404:
+            return False
+        raise
+
+
+@dataclass
+class AgentStats:
+    writes: int = 0
+    skips: int = 0
+    deletes: int = 0
+    watch_restarts: int = 0
+    relists: int = 0
+
+
+class NodeCapabilityAgent:
+    """
+    Informer-style agent: list nodes once, then watch from the list resourceVersion.
+    Only ConfigMaps whose capabilities hash changed are written.
+    """
+
+    def __init__(self):
+        self.v1 = _core_v1()
+        self.stats = AgentStats()
+        self._hashes: dict[str, str | None] = {}
+        self._resource_version: str | None = None
+
+    def seed_from_configmaps(self) -> None:
+        # Pick up hashes written by a previous run so a restart does not rewrite every node.
+        cms = self.v1.list_namespaced_config_map(
+            namespace=NAMESPACE,
+            label_selector=CAPS_LABEL_SELECTOR,
+        ).items
+        for cm in cms:
+            name = cm.metadata.name or ""
+            if not name.startswith(CM_PREFIX):
+                continue
+            annotations = cm.metadata.annotations or {}
+            self._hashes[name[len(CM_PREFIX):]] = annotations.get(HASH_ANNOTATION)
+
+    def sync_node(self, node) -> None:
+        caps = node_capabilities(node)
+        caps_hash = capabilities_hash(caps)
+        node_name = node.metadata.name
+
+        if self._hashes.get(node_name) == caps_hash:
+            self.stats.skips += 1
+            return
+
+        upsert_configmap_for_node(node_name, caps, caps_hash)
+        self._hashes[node_name] = caps_hash
+        self.stats.writes += 1
+
+    def forget_node(self, node_name: str) -> None:
+        self._hashes.pop(node_name, None)
+        if delete_configmap_for_node(node_name):
+            self.stats.deletes += 1
+
+    def relist(self) -> None:
+        node_list = self.v1.list_node()
+        self.stats.relists += 1
+
+        live = set()
+        for node in node_list.items:
+            live.add(node.metadata.name)
+            self.sync_node(node)
+
+        # Garbage-collect ConfigMaps of nodes that disappeared while we were not watching.
+        for node_name in list(self._hashes):
+            if node_name not in live:
+                self.forget_node(node_name)
+
+        self._resource_version = node_list.metadata.resource_version
+
+    def _handle_event(self, event: dict) -> None:
+        etype = event.get("type")
+        obj = event.get("object")
+
+        if etype == "ERROR":
+            code = obj.get("code") if isinstance(obj, dict) else None
+            raise ApiException(status=code or 500, reason="watch error event")
+
+        rv = getattr(getattr(obj, "metadata", None), "resource_version", None)
+        if rv is None:
+            # BOOKMARK objects are not deserialized by the client and arrive as raw dicts.
+            raw = event.get("raw_object") or (obj if isinstance(obj, dict) else {})
+            rv = (raw.get("metadata") or {}).get("resourceVersion")
+        if rv:
+            self._resource_version = rv
+
+        if etype in ("ADDED", "MODIFIED"):
+            self.sync_node(obj)
+        elif etype == "DELETED":
+            self.forget_node(obj.metadata.name)
+        # BOOKMARK: only the resourceVersion matters, handled above.
+
+    def watch_once(self) -> None:
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                self.v1.list_node,
+                resource_version=self._resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            ):
+                self._handle_event(event)
+        finally:
+            w.stop()
+
+    def emit_stats(self) -> None:
+        print(json.dumps({"kubeyugAgentStats": asdict(self.stats)}), flush=True)
+        if profiling.is_enabled():
+            # Flush per cycle instead of holding every span until exit.
+            print(json.dumps({"kubeyugAgentProfile": profiling.summary()["summary"]}), flush=True)
+            profiling.reset()
+        restarts = self.stats.watch_restarts
+        self.stats = AgentStats(watch_restarts=restarts)
+
+    def run_once(self) -> None:
+        ensure_namespace()
+        self.seed_from_configmaps()
+        self.relist()
+        self.emit_stats()
+
+    def run_forever(self) -> None:
+        ensure_namespace()
+        self.seed_from_configmaps()
+
+        backoff = 1.0
+        while True:
+            try:
+                if self._resource_version is None:
+                    self.relist()
+                self.watch_once()
+                backoff = 1.0
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old: fall back to a full relist.
+                    self._resource_version = None
+                else:
+                    print(f"Watch failed ({e.status}); retrying in {backoff:.0f}s")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, BACKOFF_MAX_SECONDS)
+            except Exception as e:
+                print(f"Watch failed ({type(e).__name__}); retrying in {backoff:.0f}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, BACKOFF_MAX_SECONDS)
+
+            self.stats.watch_restarts += 1
+            self.emit_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="kubeyug-agent")
+    parser.add_argument("--watch", action="store_true", help="Keep running and follow node changes")
+    args = parser.parse_args()
+
+    agent = NodeCapabilityAgent()
+    if args.watch:
+        agent.run_forever()
+    else:
+        agent.run_once()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Stand-in `helm` binary for offline benchmarks.
+
+Understands the subset of helm that kubeyug calls (repo add/update, upgrade --install, list,
+status, history, uninstall) and keeps releases as one JSON file per release under
+$KUBEYUG_BENCH_HELM_STATE, so concurrent installs never contend on a shared file.
+--kube-context <ctx> switches to the $KUBEYUG_BENCH_HELM_STATE/<ctx> subdirectory, and contexts
+listed in $KUBEYUG_BENCH_HELM_UNREACHABLE (comma-separated) fail like an unreachable cluster.
+
+Every call sleeps $KUBEYUG_BENCH_HELM_LATENCY_MS first to model helm's own cost.
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+STATE_DIR = Path(os.environ.get("KUBEYUG_BENCH_HELM_STATE", "/tmp/kubeyug-bench-helm"))
+UNREACHABLE = {c for c in os.environ.get("KUBEYUG_BENCH_HELM_UNREACHABLE", "").split(",") if c}
+LATENCY_S = float(os.environ.get("KUBEYUG_BENCH_HELM_LATENCY_MS", "0")) / 1000
+
+
+def _option(args: list[str], *names: str) -> str | None:
+    for i, a in enumerate(args):
+        if a in names and i + 1 < len(args):
+            return args[i + 1]
+    return None
+
+
+def _positional(args: list[str]) -> list[str]:
+    out, skip = [], False
+    for a in args:
+        if skip:
+            skip = False
+        elif a in ("-n", "--namespace", "--version", "-o", "--output", "--kube-context", "-m", "--max"):
+            skip = True
+        elif not a.startswith("-"):
+            out.append(a)
+    return out
+
+
+def _path(namespace: str, release: str) -> Path:
+    return STATE_DIR / f"{namespace}.{release}.json"
+
+
+def _load(namespace: str, release: str) -> dict | None:
+    try:
+        return json.loads(_path(namespace, release).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def _all_releases() -> list[dict]:
+    return [json.loads(p.read_text(encoding="utf-8")) for p in sorted(STATE_DIR.glob("*.json"))]
+
+
+def _not_found(release: str) -> int:
+    print(f"Error: release: not found: {release}", file=sys.stderr)
+    return 1
+
+
+def upgrade(args: list[str]) -> int:
+    release, chart = _positional(args)[:2]
+    namespace = _option(args, "-n", "--namespace") or "default"
+    version = _option(args, "--version") or "1.0.0"
+    prev = _load(namespace, release)
+
+    rel = {
+        "name": release,
+        "namespace": namespace,
+        "revision": str(int(prev["revision"]) + 1 if prev else 1),
+        "updated": datetime.now(timezone.utc).isoformat(),
+        "status": "deployed",
+        "chart": f"{chart.split('/')[-1]}-{version}",
+        "app_version": version,
+    }
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = _path(namespace, release).with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(rel), encoding="utf-8")
+    os.replace(tmp, _path(namespace, release))
+    print(f'Release "{release}" has been upgraded. Happy Helming!')
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    global STATE_DIR
+    time.sleep(LATENCY_S)
+    context = _option(argv, "--kube-context")
+    if context in UNREACHABLE:
+        print(f"Error: Kubernetes cluster unreachable: context {context}", file=sys.stderr)
+        return 1
+    if context:
+        STATE_DIR = STATE_DIR / context
+    if argv[:1] == ["repo"]:
+        return 0
+    if argv[:1] == ["upgrade"]:
+        return upgrade(argv[1:])
+    if argv[:1] == ["list"]:
+        namespace = _option(argv, "-n", "--namespace")
+        limit = int(_option(argv, "-m", "--max") or 256)  # helm's default; 0 = unlimited
+        rels = [r for r in _all_releases() if namespace is None or r["namespace"] == namespace]
+        if "--all" not in argv and "-a" not in argv:
+            rels = [r for r in rels if r["status"] in ("deployed", "failed")]
+        print(json.dumps(rels[:limit] if limit else rels))
+        return 0
+    if argv[:1] in (["status"], ["history"], ["uninstall"]):
+        release = _positional(argv[1:])[0]
+        namespace = _option(argv, "-n", "--namespace") or "default"
+        rel = _load(namespace, release)
+        if rel is None:
+            return _not_found(release)
+        if argv[0] == "uninstall":
+            _path(namespace, release).unlink()
+            print(f'release "{release}" uninstalled')
+        elif argv[0] == "status":
+            print(json.dumps({"name": release, "namespace": namespace, "info": {"status": rel["status"]}, "version": int(rel["revision"])}))
+        else:
+            print(json.dumps([{"revision": int(rel["revision"]), "status": rel["status"], "chart": rel["chart"]}]))
+        return 0
+
+    print(f"fake helm: unsupported command: {' '.join(argv)}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
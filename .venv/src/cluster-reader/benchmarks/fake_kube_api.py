@@ -0,0 +1,243 @@
+"""
+Local stand-in for the slice of the Kubernetes API that kubeyug uses.
+
+Serves ConfigMaps (get/list/create/replace/patch/delete) and a synthetic node list over plain
+HTTP, with the behaviour the real client code relies on: label selectors, limit/continue
+pagination, list resourceVersions, node watches with bookmarks and 404/409 Status responses.
+Point a kubeconfig at it:
+
+    python benchmarks/fake_kube_api.py --port 8090 --nodes 1000 &
+    # kubeconfig cluster.server = http://127.0.0.1:8090
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeKubeState:
+    def __init__(self, nodes: int, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.resource_version = 1
+        self.namespaces: set[str] = {"default", "kubeyug"}
+        # (namespace, name) -> ConfigMap dict
+        self.configmaps: dict[tuple[str, str], dict] = {}
+        self.nodes = [_node(i, self._next_rv()) for i in range(nodes)]
+
+    def _next_rv(self) -> str:
+        self.resource_version += 1
+        return str(self.resource_version)
+
+
+def _node(i: int, rv: str) -> dict:
+    return {
+        "metadata": {
+            "name": f"node-{i:05d}",
+            "resourceVersion": rv,
+            "labels": {"kubernetes.io/arch": "arm64" if i % 4 == 0 else "amd64", "kubernetes.io/os": "linux"},
+        },
+        "status": {
+            "capacity": {"cpu": "3500m" if i % 2 else "4", "memory": "16Gi"},
+            "nodeInfo": {
+                "architecture": "amd64",
+                "bootID": f"boot-{i}",
+                "containerRuntimeVersion": "containerd://1.7.0",
+                "kernelVersion": "6.1.0",
+                "kubeProxyVersion": "v1.29.0",
+                "kubeletVersion": "v1.29.0",
+                "machineID": f"machine-{i}",
+                "operatingSystem": "linux",
+                "osImage": "Fake Linux",
+                "systemUUID": f"uuid-{i}",
+            },
+        },
+    }
+
+
+def _status(code: int, reason: str, message: str) -> dict:
+    return {"kind": "Status", "apiVersion": "v1", "metadata": {}, "status": "Failure", "message": message, "reason": reason, "code": code}
+
+
+def _matches(labels: dict, selector: str | None) -> bool:
+    if not selector:
+        return True
+    for term in selector.split(","):
+        key, _, value = term.partition("=")
+        if labels.get(key.strip()) != value.strip():
+            return False
+    return True
+
+
+def _page(kind: str, items: list[dict], query: dict, rv: str) -> dict:
+    start = int(query.get("continue", ["0"])[0] or 0)
+    limit = int(query.get("limit", ["0"])[0] or 0)
+    end = start + limit if limit else len(items)
+    return {
+        "kind": kind,
+        "apiVersion": "v1",
+        "metadata": {"resourceVersion": rv, "continue": str(end) if end < len(items) else None},
+        "items": items[start:end],
+    }
+
+
+def make_handler(state: FakeKubeState):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code: int, payload: dict):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_watch(self, query: dict):
+            """
+            One watch window: ADDED for every node newer than resourceVersion, then a BOOKMARK
+            at the current resourceVersion (if requested), then the stream ends.
+            """
+            since = int(query.get("resourceVersion", ["0"])[0] or 0)
+            events = [{"type": "ADDED", "object": n} for n in state.nodes if int(n["metadata"]["resourceVersion"]) > since]
+            if query.get("allowWatchBookmarks", ["false"])[0] == "true":
+                bookmark = {"kind": "Node", "apiVersion": "v1", "metadata": {"resourceVersion": str(state.resource_version)}}
+                events.append({"type": "BOOKMARK", "object": bookmark})
+
+            data = "".join(json.dumps(e) + "\n" for e in events).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self) -> dict:
+            return json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+
+        def _route(self, method: str):
+            with state.lock:
+                state.requests += 1
+            time.sleep(state.latency)
+
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            parts = [p for p in url.path.split("/") if p]
+            body = self._body() if method in ("POST", "PUT", "PATCH") else None
+
+            with state.lock:
+                if parts == ["api", "v1", "nodes"] and method == "GET":
+                    if query.get("watch", ["false"])[0] == "true":
+                        return self._send_watch(query)
+                    return self._send(200, _page("NodeList", state.nodes, query, str(state.resource_version)))
+
+                if parts == ["api", "v1", "namespaces"] and method == "POST":
+                    name = body["metadata"]["name"]
+                    if name in state.namespaces:
+                        return self._send(409, _status(409, "AlreadyExists", f'namespaces "{name}" already exists'))
+                    state.namespaces.add(name)
+                    return self._send(201, body)
+
+                if len(parts) in (5, 6) and parts[:3] == ["api", "v1", "namespaces"] and parts[4] == "configmaps":
+                    return self._configmaps(method, parts[3], parts[5] if len(parts) == 6 else None, query, body)
+
+            return self._send(404, _status(404, "NotFound", f"no route for {method} {url.path}"))
+
+        def _configmaps(self, method: str, namespace: str, name: str | None, query: dict, body: dict | None):
+            if name is None and method == "GET":
+                selector = query.get("labelSelector", [None])[0]
+                items = [
+                    cm
+                    for (ns, _), cm in sorted(state.configmaps.items())
+                    if ns == namespace and _matches(cm["metadata"].get("labels") or {}, selector)
+                ]
+                return self._send(200, _page("ConfigMapList", items, query, str(state.resource_version)))
+
+            if name is None and method == "POST":
+                name = body["metadata"]["name"]
+                if (namespace, name) in state.configmaps:
+                    return self._send(409, _status(409, "AlreadyExists", f'configmaps "{name}" already exists'))
+                return self._store(201, namespace, name, body)
+
+            existing = state.configmaps.get((namespace, name))
+            if existing is None:
+                return self._send(404, _status(404, "NotFound", f'configmaps "{name}" not found'))
+
+            if method == "GET":
+                return self._send(200, existing)
+            if method == "DELETE":
+                del state.configmaps[(namespace, name)]
+                return self._send(200, {"kind": "Status", "apiVersion": "v1", "status": "Success"})
+            if method == "PUT":
+                sent_rv = (body.get("metadata") or {}).get("resourceVersion")
+                if sent_rv and sent_rv != existing["metadata"]["resourceVersion"]:
+                    return self._send(409, _status(409, "Conflict", f'Operation cannot be fulfilled on configmaps "{name}"'))
+                return self._store(200, namespace, name, body)
+            if method == "PATCH":
+                merged = json.loads(json.dumps(existing))
+                meta = body.get("metadata") or {}
+                for field in ("labels", "annotations"):
+                    merged["metadata"].setdefault(field, {}).update(meta.get(field) or {})
+                merged.setdefault("data", {}).update(body.get("data") or {})
+                return self._store(200, namespace, name, merged)
+
+            return self._send(405, _status(405, "MethodNotAllowed", method))
+
+        def _store(self, code: int, namespace: str, name: str, body: dict):
+            cm = {
+                "kind": "ConfigMap",
+                "apiVersion": "v1",
+                "metadata": {**(body.get("metadata") or {}), "name": name, "namespace": namespace, "resourceVersion": state._next_rv()},
+                "data": body.get("data") or {},
+            }
+            state.configmaps[(namespace, name)] = cm
+            return self._send(code, cm)
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def do_PUT(self):
+            self._route("PUT")
+
+        def do_PATCH(self):
+            self._route("PATCH")
+
+        def do_DELETE(self):
+            self._route("DELETE")
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def serve(port: int = 0, nodes: int = 0, latency: float = 0.0) -> tuple[ThreadingHTTPServer, FakeKubeState]:
+    """
+    Start the fake API server in a background thread; returns (server, state). Port 0 picks a free port.
+    """
+    state = FakeKubeState(nodes, latency)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="fake-kube-api")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--nodes", type=int, default=3, help="Number of synthetic nodes to serve")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to sleep per request (simulated latency)")
+    args = parser.parse_args()
+
+    server, _ = serve(args.port, args.nodes, args.latency)
+    print(f"Fake Kubernetes API on http://127.0.0.1:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Offline throughput benchmarks for the Helm and Kubernetes paths.
+
+No cluster, network or real helm is needed. helm is replaced by benchmarks/fake_helm.py on
+PATH and the Kubernetes API by benchmarks/fake_kube_api.py behind a generated kubeconfig.
+The kubeyug cache dir is redirected to a temp dir, so your real cache is never touched.
+
+Scenarios, each run at every size (releases or nodes):
+- install: execute_plan() over N synthetic releases (one repo add/update, N upgrades)
+- status:  one `helm list` over N releases + build_fleet_status()
+- state:   N record_install() writes + one list_releases()
+- nodes:   load_cluster_summary() over N nodes, cold and from the rollup cache
+
+Usage:
+    python benchmarks/run.py                                  # 10/100/1000, print a table
+    python benchmarks/run.py --sizes 10,100 --json > base.json
+    python benchmarks/run.py --baseline base.json             # exit 1 on regression
+    python benchmarks/run.py --scenarios state --profile --json
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH = Path(__file__).resolve().parent
+sys.path[:0] = [str(ROOT), str(BENCH)]
+
+SCENARIOS = ("install", "status", "state", "nodes")
+DEFAULT_SIZES = "10,100,1000"
+
+
+def _write_kubeconfig(path: Path, server: str) -> None:
+    # JSON is valid YAML, which is all load_kube_config needs.
+    path.write_text(
+        json.dumps(
+            {
+                "apiVersion": "v1",
+                "kind": "Config",
+                "clusters": [{"name": "bench", "cluster": {"server": server}}],
+                "users": [{"name": "bench", "user": {"token": "bench"}}],
+                "contexts": [{"name": "bench", "context": {"cluster": "bench", "user": "bench", "namespace": "default"}}],
+                "current-context": "bench",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _write_helm_shim(bin_dir: Path) -> None:
+    shim = bin_dir / "helm"
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{BENCH / "fake_helm.py"}" "$@"\n', encoding="utf-8")
+    shim.chmod(0o755)
+
+
+def _prepare_env(work: Path, server: str, helm_latency_ms: float) -> None:
+    """
+    Must run before anything under kubeyug is imported: cache paths are resolved at import time.
+    """
+    bin_dir = work / "bin"
+    bin_dir.mkdir()
+    _write_helm_shim(bin_dir)
+    _write_kubeconfig(work / "kubeconfig", server)
+
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+    os.environ["KUBECONFIG"] = str(work / "kubeconfig")
+    os.environ["XDG_CACHE_HOME"] = str(work / "cache")
+    os.environ["KUBEYUG_BENCH_HELM_STATE"] = str(work / "helm")
+    os.environ["KUBEYUG_BENCH_HELM_LATENCY_MS"] = str(helm_latency_ms)
+    os.environ["KUBEYUG_REGISTRY_BACKGROUND_REFRESH"] = "0"
+    os.environ.pop("KUBEYUG_REGISTRY_URL", None)
+    os.environ.pop("KUBEYUG_VERBOSE", None)
+
+
+def _reset_helm(work: Path) -> Path:
+    helm_dir = work / "helm"
+    shutil.rmtree(helm_dir, ignore_errors=True)
+    helm_dir.mkdir()
+    return helm_dir
+
+
+def _seed_helm_releases(helm_dir: Path, n: int) -> None:
+    # Same on-disk shape fake_helm.py writes, without paying n subprocess starts.
+    for i in range(n):
+        rel = {
+            "name": f"bench-{i:05d}",
+            "namespace": f"ns-{i % 10}",
+            "revision": "1",
+            "updated": "2026-01-01T00:00:00+00:00",
+            "status": "deployed",
+            "chart": "chart-1.0.0",
+            "app_version": "1.0.0",
+        }
+        (helm_dir / f"{rel['namespace']}.{rel['name']}.json").write_text(json.dumps(rel), encoding="utf-8")
+
+
+def bench_install(ctx: dict, n: int) -> dict:
+    from kubeyug.install_plan import InstallPlan, PlannedRelease, execute_plan
+
+    _reset_helm(ctx["work"])
+    releases = [
+        PlannedRelease(
+            key=f"bench-{i:05d}",
+            tool={"helm_chart": "bench/chart", "version": "1.0.0"},
+            namespace=f"ns-{i % 10}",
+        )
+        for i in range(n)
+    ]
+    plan = InstallPlan(releases=releases, repos={"bench": "https://charts.example.invalid"})
+
+    start = time.perf_counter()
+    results = execute_plan(plan, jobs=ctx["jobs"])
+    seconds = time.perf_counter() - start
+
+    failed = [r for r in results if r.status != "ok"]
+    if failed:
+        raise SystemExit(f"install benchmark: {len(failed)} release(s) failed, e.g. {failed[0].error}")
+    return {"seconds": seconds}
+
+
+def bench_status(ctx: dict, n: int) -> dict:
+    from kubeyug.fleet_status import build_fleet_status, fetch_releases
+
+    _seed_helm_releases(_reset_helm(ctx["work"]), n)
+
+    start = time.perf_counter()
+    releases = fetch_releases()
+    build_fleet_status(releases, {})
+    seconds = time.perf_counter() - start
+
+    if len(releases) != n:
+        raise SystemExit(f"status benchmark: helm list returned {len(releases)} releases, expected {n}")
+    return {"seconds": seconds}
+
+
+def bench_state(ctx: dict, n: int) -> dict:
+    from kubeyug.state import list_releases, record_install
+
+    with ctx["api"].lock:
+        ctx["api"].configmaps.clear()
+    # Client construction and the first connection are not per-write costs.
+    list_releases()
+
+    start = time.perf_counter()
+    for i in range(n):
+        record_install(tool_key=f"bench-{i:05d}", namespace=f"ns-{i % 10}", chart="bench/chart", release=f"bench-{i:05d}")
+    listed = list_releases()
+    seconds = time.perf_counter() - start
+
+    if len(listed) != n:
+        raise SystemExit(f"state benchmark: listed {len(listed)} releases, expected {n}")
+    return {"seconds": seconds}
+
+
+def bench_nodes(ctx: dict, n: int) -> dict:
+    from fake_kube_api import _node
+    from kubeyug.kube import load_cluster_summary
+
+    api = ctx["api"]
+    with api.lock:
+        api.configmaps.clear()
+        api.nodes = [_node(i, api._next_rv()) for i in range(n)]
+
+    start = time.perf_counter()
+    summary = load_cluster_summary(use_cache=False)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_cluster_summary(use_cache=True)
+    cached = time.perf_counter() - start
+
+    if summary["nodes"] != n:
+        raise SystemExit(f"nodes benchmark: summarized {summary['nodes']} nodes, expected {n}")
+    return {"seconds": cold, "cachedSeconds": cached}
+
+
+BENCHES = {"install": bench_install, "status": bench_status, "state": bench_state, "nodes": bench_nodes}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    A case regresses when it is more than `tolerance` (fraction) slower than the baseline.
+    Cases missing from either side are ignored.
+    """
+    regressions = []
+    for scenario, by_size in results.items():
+        for size, res in by_size.items():
+            base = baseline.get(scenario, {}).get(size)
+            if not base:
+                continue
+            limit = base["seconds"] * (1 + tolerance)
+            if res["seconds"] > limit:
+                regressions.append(f"{scenario}@{size}: {res['seconds']:.3f}s > {base['seconds']:.3f}s baseline (+{tolerance:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="kubeyug-benchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated release/node counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--jobs", type=int, default=8, help="Parallel helm upgrades in the install scenario (default: 8)")
+    parser.add_argument("--helm-latency-ms", type=float, default=0.0, help="Extra latency per fake helm call")
+    parser.add_argument("--api-latency-ms", type=float, default=0.0, help="Extra latency per fake Kubernetes API request")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run; exit 1 if any case regressed")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs. baseline, as a fraction (default: 0.25)")
+    parser.add_argument("--profile", action="store_true", help="Attach a kubeyug span summary to every case")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    from fake_kube_api import serve
+
+    server, api = serve(nodes=0, latency=args.api_latency_ms / 1000)
+    work = Path(tempfile.mkdtemp(prefix="kubeyug-bench-"))
+    try:
+        _prepare_env(work, f"http://127.0.0.1:{server.server_address[1]}", args.helm_latency_ms)
+
+        from kubeyug import profiling
+
+        if args.profile:
+            # Enable before any kubeyug client is created so API objects get instrumented.
+            profiling.enable(emit_at_exit=False)
+
+        ctx = {"work": work, "api": api, "jobs": args.jobs}
+        results: dict[str, dict[str, dict]] = {}
+        for scenario in scenarios:
+            for n in sizes:
+                profiling.reset()
+                requests_before = api.requests
+                res = BENCHES[scenario](ctx, n)
+                res["perItemMs"] = res["seconds"] * 1000 / max(n, 1)
+                res["apiRequests"] = api.requests - requests_before
+                if args.profile:
+                    res["profile"] = profiling.summary()["summary"]
+                results.setdefault(scenario, {})[str(n)] = res
+    finally:
+        server.shutdown()
+        shutil.rmtree(work, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for scenario, by_size in results.items():
+            for size, res in by_size.items():
+                extra = f"  cached={res['cachedSeconds'] * 1000:.1f}ms" if "cachedSeconds" in res else ""
+                print(
+                    f"{scenario:<8} n={size:<6} {res['seconds']:8.3f}s  {res['perItemMs']:7.2f}ms/item"
+                    f"  api={res['apiRequests']}{extra}"
+                )
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nBenchmark regressions:", file=sys.stderr)
+            for r in regressions:
+                print(f"  {r}", file=sys.stderr)
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+CLI startup benchmark.
+
+Runs `python cli.py <args>` for each subcommand path and checks:
+- startup overhead (best of N runs, minus a bare `python -c pass`) stays under its budget
+- heavyweight modules (kubernetes, oumi) are not imported on paths that don't need them
+
+Timing runs do not use -X importtime (it inflates wall time); one extra run per case with
+-X importtime lists the imported modules. Budgets are relative to the bare interpreter so
+they hold on slower machines too.
+
+Usage:
+    python benchmarks/startup.py            # check budgets, exit 1 on regression
+    python benchmarks/startup.py --json     # machine-readable results
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "cli.py"
+
+HEAVY_MODULES = ("kubernetes", "oumi")
+
+# (name, argv, budget in ms over a bare interpreter). Every case here must stay off the network
+# and the cluster.
+CASES = [
+    ("help", ["--help"], 80),
+    ("list", ["list"], 80),
+    ("install-dry-run", ["install", "prometheus", "--dry-run"], 80),
+    ("status-dry-run", ["status", "prometheus", "--dry-run"], 80),
+    ("history-dry-run", ["history", "prometheus", "--dry-run"], 80),
+    ("uninstall-dry-run", ["uninstall", "prometheus", "--dry-run"], 80),
+    ("banner", ["banner"], 80),
+]
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    # Never let a configured remote registry turn the benchmark into a network test.
+    env.pop("KUBEYUG_REGISTRY_URL", None)
+    return env
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    # -X importtime lines: "import time:   self [us] | cumulative | imported package"
+    mods = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        if name and name != "imported package":
+            mods.add(name)
+    return mods
+
+
+def _best_ms(cmd: list[str], runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=ROOT, env=_env(), capture_output=True, text=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            raise SystemExit(f"`{' '.join(cmd[1:])}` failed:\n{proc.stderr[-2000:]}")
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_case(argv: list[str], runs: int, baseline_ms: float) -> dict:
+    wall = _best_ms([sys.executable, str(CLI), *argv], runs)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(CLI), *argv],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+    modules = _imported_modules(proc.stderr)
+
+    heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+    return {
+        "wall_ms": round(wall, 1),
+        "overhead_ms": round(wall - baseline_ms, 1),
+        "modules": len(modules),
+        "heavy_imports": heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="startup-benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case; the best is kept (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    baseline_ms = _best_ms([sys.executable, "-c", "pass"], args.runs)
+
+    results = {}
+    failures = []
+    for name, argv, budget_ms in CASES:
+        res = run_case(argv, args.runs, baseline_ms)
+        res["budget_ms"] = budget_ms
+        results[name] = res
+
+        if res["overhead_ms"] > budget_ms:
+            failures.append(f"{name}: +{res['overhead_ms']}ms over bare python > {budget_ms}ms budget")
+        if res["heavy_imports"]:
+            failures.append(f"{name}: imports {', '.join(res['heavy_imports'][:3])}")
+
+    if args.json:
+        print(json.dumps({"baseline_ms": round(baseline_ms, 1), "cases": results}, indent=2))
+    else:
+        print(f"{'python -c pass':<18} {baseline_ms:7.1f}ms")
+        for name, res in results.items():
+            print(
+                f"{name:<18} {res['wall_ms']:7.1f}ms  +{res['overhead_ms']:.1f}ms / {res['budget_ms']}ms"
+                f"  modules={res['modules']}"
+            )
+
+    if failures:
+        print("\nStartup budget exceeded:", file=sys.stderr)
+        for f in failures:
+            print(f"  {f}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Local stand-in for an OpenAI-compatible /v1/chat/completions endpoint.
+
+It answers every prompt built by build_tool_selection_prompt with the first allowed tool key,
+so the Oumi decision path (cache, batching, parsing) can be exercised without a real model:
+
+    python benchmarks/stub_openai_server.py --port 8089 --delay 0.5 &
+    KUBEYUG_LLM_BASE_URL=http://127.0.0.1:8089/v1/chat/completions KUBEYUG_LLM_API_KEY=stub \\
+        python cli.py install monitoring --oumi --dry-run
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.requests = 0
+        self.lock = threading.Lock()
+
+
+def _choose(prompt: str) -> dict:
+    # The prompt ends with "INPUT:\n{json}"; pick the first allowed key.
+    blob = prompt.split("INPUT:", 1)[-1].strip()
+    try:
+        allowed = json.loads(blob).get("allowed_tool_keys") or []
+    except ValueError:
+        allowed = []
+    return {
+        "chartKey": allowed[0] if allowed else "",
+        "reason": "Stub server: first allowed tool.",
+        "confidence": 0.9,
+    }
+
+
+def make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            with state.lock:
+                state.requests += 1
+            time.sleep(state.delay)
+
+            messages = body.get("messages") or [{}]
+            answer = _choose(str(messages[-1].get("content", "")))
+            payload = {
+                "id": f"stub-{state.requests}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": json.dumps(answer)},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def serve(port: int = 0, delay: float = 0.0) -> tuple[ThreadingHTTPServer, StubState]:
+    """
+    Start the stub in a background thread; returns (server, state). Port 0 picks a free port.
+    """
+    state = StubState(delay)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="stub-openai-server")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to sleep per request (simulated latency)")
+    args = parser.parse_args()
+
+    server, _ = serve(args.port, args.delay)
+    print(f"Stub OpenAI-compatible server on http://127.0.0.1:{server.server_address[1]}/v1/chat/completions")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
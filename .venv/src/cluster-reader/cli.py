@@ -0,0 +1,60 @@
+import argparse
+import importlib
+import sys
+
+from kubeyug import profiling
+
+# name -> (module, register function, help). Only the chosen subcommand's module is imported,
+# so `kubeyug --help` / `kubeyug list` never pay for Kubernetes, Oumi or the other commands.
+COMMANDS = {
+    "install": ("kubeyug.commands.install", "register_install_command", "Install one or more tools or stacks"),
+    "status": ("kubeyug.commands.status", "register_status_command", "Show Helm status for a tool key"),
+    "list": ("kubeyug.commands.list_cmd", "register_list_command", "List registry tools (and optionally Helm releases)"),
+    "uninstall": ("kubeyug.commands.uninstall", "register_uninstall_command", "Uninstall a tool (Helm release) by tool key"),
+    "history": ("kubeyug.commands.rollback", "register_history_command", "Show Helm history for a tool"),
+    "rollback": ("kubeyug.commands.rollback", "register_rollback_command", "Rollback a Helm release for a tool"),
+    "registry": ("kubeyug.commands.registry_cmd", "register_registry_command", "Manage the local tool registry cache"),
+    "banner": ("kubeyug.commands.banner", "register_banner_command", "Print the Kubeyug banner"),
+}
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    for arg in argv:
+        if arg.startswith("-"):
+            continue
+        return arg if arg in COMMANDS else None
+    return None
+
+
+def build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kubeyug")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a timing breakdown (helm, Kubernetes API, registry, LLM) to stderr on exit",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    chosen = _requested_command(argv)
+    for name, (module, register, help_text) in COMMANDS.items():
+        if name == chosen:
+            getattr(importlib.import_module(module), register)(sub)
+        else:
+            sub.add_parser(name, help=help_text)
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # The registry is loaded (and validated) by the commands that look tools up, not up front.
+    args = build_parser(argv).parse_args(argv)
+    if args.profile:
+        profiling.enable()
+    with profiling.span(f"command.{args.command}"):
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from kubeyug.registry import find_tool, tools_in_category
+from kubeyug.helm_ops import helm_apply_release
+from kubeyug.install_plan import build_plan, execute_plan, print_results
+
+
+def decide_monitoring_stack(cluster_summary: dict, tools: list[dict], use_oumi: bool) -> dict:
+    """
+    Demo behavior:
+    - Default: deterministic safe choice (prometheus).
+    - Optional: if --oumi is passed, then try Oumi (lazy import so startup stays fast).
+    """
+    if not use_oumi:
+        return {
+            "tool": "prometheus",
+            "reason": "Demo default: Prometheus is enough for basic monitoring.",
+            "chartKey": "prometheus",
+        }
+
+    try:
+        from kubeyug.oumi.oumi_client import OumiClient
+
+        client = OumiClient()
+        decision = client.decide(goal="monitoring", cluster_summary=cluster_summary, tools=tools)
+    except ImportError as e:
+        # oumi itself is imported lazily, only on a decision-cache miss.
+        return {
+            "tool": "prometheus",
+            "reason": f"Oumi not available ({type(e).__name__}); falling back to Prometheus.",
+            "chartKey": "prometheus",
+        }
+
+    st = client.stats
+    source = "cache hit" if st.cache_hits else f"model ({st.infer_ms:.0f}ms inference)"
+    print(f"Oumi decision: {source}, {st.total_ms:.0f}ms total")
+    return decision
+
+
+def install_key_as_helm(key: str, namespace_override: str | None, dry_run: bool):
+    found = find_tool(key)
+    if not found:
+        raise SystemExit(f"Unknown tool key: {key}")
+    _, tool = found
+
+    ns = namespace_override or tool["namespace"]
+    print(f"Installing/updating {tool['name']} (key={key}) in namespace '{ns}' via Helm...\n")
+
+    helm_apply_release(
+        release=key,
+        chart=tool["helm_chart"],
+        namespace=ns,
+        repo_name=tool["helm_repo_name"],
+        repo_url=tool["helm_repo_url"],
+        version=tool.get("version"),
+        dry_run=dry_run,
+    )
+
+    if not dry_run:
+        from kubeyug.state import record_install
+        record_install(tool_key=key, namespace=ns, chart=tool["helm_chart"], release=key)
+
+
+def choose_monitoring_tool(use_oumi: bool) -> str:
+    # kubernetes client import is deferred to the one install path that reads the cluster.
+    from kubeyug.kube import load_cluster_summary
+
+    summary = load_cluster_summary()
+
+    tools = tools_in_category("monitoring")
+    if not tools:
+        raise SystemExit("No monitoring tools found in registry.")
+
+    decision = decide_monitoring_stack(summary, tools=tools, use_oumi=use_oumi)
+    tool_key = decision.get("chartKey")
+    if not tool_key:
+        raise SystemExit("Decision did not return chartKey.")
+
+    print("Cluster summary:", summary)
+    print("Decision:", decision, "\n")
+    return tool_key
+
+
+def install_monitoring_smart(namespace_override: str | None, dry_run: bool, use_oumi: bool):
+    tool_key = choose_monitoring_tool(use_oumi)
+    install_key_as_helm(tool_key, namespace_override=namespace_override, dry_run=dry_run)
+
+
+def install_many(targets: list[str], namespace_override: str | None, dry_run: bool, jobs: int, fail_fast: bool):
+    plan = build_plan(targets, namespace_override=namespace_override)
+    names = ", ".join(f"{r.key}->{r.namespace}" for r in plan.releases)
+    print(f"Installing/updating {len(plan.releases)} release(s) via Helm: {names}\n")
+
+    record = None
+    if not dry_run:
+        from kubeyug.state import record_install
+
+        def record(release):
+            record_install(
+                tool_key=release.key,
+                namespace=release.namespace,
+                chart=release.tool["helm_chart"],
+                release=release.key,
+            )
+
+    results = execute_plan(plan, jobs=jobs, fail_fast=fail_fast, dry_run=dry_run, on_success=record)
+    print()
+    print_results(results)
+
+    failed = [r.key for r in results if r.status != "ok"]
+    if failed:
+        raise SystemExit(f"Install did not complete for: {', '.join(failed)}")
+    unrecorded = [r.key for r in results if r.error]
+    if unrecorded:
+        raise SystemExit(f"Installed, but kubeyug state was not recorded for: {', '.join(unrecorded)}")
+
+
+def cmd_install(args):
+    if args.targets == ["monitoring"] and not args.helm:
+        install_monitoring_smart(
+            namespace_override=args.namespace,
+            dry_run=args.dry_run,
+            use_oumi=args.oumi,
+        )
+        return
+
+    targets = args.targets
+    if "monitoring" in targets and not args.helm:
+        # "monitoring" is a goal, not a tool key: resolve it to a tool before planning.
+        chosen = choose_monitoring_tool(args.oumi)
+        targets = [chosen if t == "monitoring" else t for t in targets]
+
+    install_many(
+        targets,
+        namespace_override=args.namespace,
+        dry_run=args.dry_run,
+        jobs=args.jobs,
+        fail_fast=not args.continue_on_error,
+    )
+
+
+def register_install_command(subparsers):
+    p = subparsers.add_parser("install", help="Install one or more tools or stacks")
+    p.add_argument("targets", nargs="+", help="e.g. 'monitoring', tool keys like 'prometheus jaeger', or a stack name")
+    p.add_argument("--helm", action="store_true", help="Force Helm install for the target key")
+    p.add_argument("--namespace", help="Override namespace from registry")
+    p.add_argument("--dry-run", action="store_true", help="Print commands without executing")
+    p.add_argument("-j", "--jobs", type=int, default=4, help="Max concurrent helm installs (default: 4)")
+    p.add_argument("--continue-on-error", action="store_true", help="Keep installing independent releases after a failure")
+
+    # New: opt-in flag to use Oumi (kept off by default to keep startup fast)
+    p.add_argument("--oumi", action="store_true", help="Use Oumi to decide (slow; optional)")
+
+    p.set_defaults(func=cmd_install)
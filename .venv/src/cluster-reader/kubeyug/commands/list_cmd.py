@@ -0,0 +1,55 @@
+import json
+from kubeyug.registry import list_registry_tools
+from kubeyug.helm_ops import helm_list
+from kubeyug.fanout import add_context_args, fan_out, print_json, print_table, report_failures, selected_contexts
+
+
+def _list_across_contexts(args, contexts: list[str]):
+    def one(ctx: str, timeout: float) -> list[dict]:
+        out = helm_list(namespace=args.namespace, kube_context=ctx, timeout=timeout, dry_run=args.dry_run)
+        return json.loads(out) if out else []
+
+    results = fan_out(contexts, one, jobs=args.jobs, timeout=args.context_timeout)
+    if args.json:
+        print_json(results)
+    else:
+        rows = [dict(rel, context=r.context) for r in results if r.ok for rel in r.value]
+        print_table(
+            rows,
+            [("CONTEXT", "context"), ("NAMESPACE", "namespace"), ("NAME", "name"), ("REVISION", "revision"),
+             ("STATUS", "status"), ("CHART", "chart"), ("APP", "app_version")],
+        )
+    report_failures(results)
+
+
+def cmd_list(args):
+    contexts = selected_contexts(args)
+    if contexts is not None:
+        # Fleet mode is about Helm releases; the registry is the same for every cluster.
+        _list_across_contexts(args, contexts)
+        return
+
+    tools = list_registry_tools()
+
+    if args.full:
+        print("Registry tools:")
+        print(json.dumps(tools, indent=2))
+    else:
+        for t in tools:
+            print(f"{t.get('category')}/{t.get('key')}: {t.get('name')}")
+
+    if args.helm:
+        print("\nHelm releases:")
+        out = helm_list(namespace=args.namespace, dry_run=args.dry_run)
+        print(out if out else "[]")
+
+
+def register_list_command(subparsers):
+    p = subparsers.add_parser("list", help="List registry tools (and optionally Helm releases)")
+    p.add_argument("--full", action="store_true", help="Print full registry JSON (slow)")
+    p.add_argument("--helm", action="store_true", help="Also show helm releases")
+    p.add_argument("--namespace", help="Filter helm list to a namespace (default: all)")
+    p.add_argument("--dry-run", action="store_true", help="Print commands without executing")
+    p.add_argument("--json", action="store_true", help="With --contexts/--all-contexts: print one merged JSON document")
+    add_context_args(p)
+    p.set_defaults(func=cmd_list)
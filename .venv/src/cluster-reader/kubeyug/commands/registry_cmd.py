@@ -0,0 +1,24 @@
+from kubeyug.registry import REGISTRY_URL, RegistryRefreshError, load_registry_index, refresh_registry_cache
+
+
+def cmd_registry_refresh(args):
+    if not REGISTRY_URL:
+        print("KUBEYUG_REGISTRY_URL is not set; using the packaged registry.")
+        return
+
+    try:
+        changed = refresh_registry_cache(force=args.force)
+    except RegistryRefreshError as e:
+        raise SystemExit(f"Registry refresh failed: {e}")
+    idx = load_registry_index()
+    state = "updated" if changed else "unchanged"
+    print(f"Registry {state}: {len(idx.tools)} tools in {len(idx.categories)} categories, {len(idx.stacks)} stacks")
+
+
+def register_registry_command(subparsers):
+    p = subparsers.add_parser("registry", help="Manage the local tool registry cache")
+    sub = p.add_subparsers(dest="registry_command", required=True)
+
+    r = sub.add_parser("refresh", help="Fetch KUBEYUG_REGISTRY_URL now and rebuild the local index")
+    r.add_argument("--force", action="store_true", help="Ignore the cached ETag and download the full registry")
+    r.set_defaults(func=cmd_registry_refresh)
@@ -0,0 +1,135 @@
+import json
+import subprocess
+from kubeyug.registry import find_tool
+from kubeyug.helm_ops import helm_history, run_cmd
+from kubeyug.fanout import (
+    add_context_args, fan_out, print_json, print_table, release_not_found, report_failures, selected_contexts,
+)
+
+
+def _helm_history(
+    release: str,
+    namespace: str,
+    dry_run: bool,
+    kube_context: str | None = None,
+    timeout: float | None = None,
+) -> list[dict]:
+    # helm history supports -o json, which makes parsing easy. [web:665]
+    out = helm_history(
+        release=release,
+        namespace=namespace,
+        kube_context=kube_context,
+        timeout=timeout,
+        dry_run=dry_run,
+    )
+    return json.loads(out or "[]")
+
+
+def _history_across_contexts(args, contexts: list[str], release: str, ns: str):
+    def one(ctx: str, timeout: float) -> list[dict] | None:
+        try:
+            return _helm_history(release, ns, dry_run=args.dry_run, kube_context=ctx, timeout=timeout)
+        except subprocess.CalledProcessError as e:
+            if release_not_found(e):
+                return None  # null in --json, "not installed" in the table
+            raise
+
+    results = fan_out(contexts, one, jobs=args.jobs, timeout=args.context_timeout)
+    if args.json:
+        print_json(results)
+    else:
+        rows = []
+        for r in results:
+            if not r.ok:
+                continue
+            if r.value is None:
+                rows.append({"context": r.context, "status": "not installed"})
+            else:
+                rows.extend(dict(row, context=r.context) for row in r.value[-args.max:])
+        print_table(
+            rows,
+            [("CONTEXT", "context"), ("REVISION", "revision"), ("STATUS", "status"),
+             ("UPDATED", "updated"), ("CHART", "chart")],
+        )
+    report_failures(results)
+
+
+def cmd_history(args):
+    found = find_tool(args.key)
+    if not found:
+        raise SystemExit(f"Unknown tool key: {args.key}")
+
+    _, tool = found
+    ns = args.namespace or tool["namespace"]
+    release = args.release or args.key
+
+    contexts = selected_contexts(args)
+    if contexts is not None:
+        _history_across_contexts(args, contexts, release, ns)
+        return
+
+    hist = _helm_history(release, ns, dry_run=args.dry_run)
+    if args.json:
+        print(json.dumps(hist, indent=2))
+        return
+
+    if not hist:
+        print("No history (or dry-run).")
+        return
+
+    # Keep output short and useful
+    for row in hist[-min(len(hist), args.max):]:
+        rev = row.get("revision")
+        status = row.get("status")
+        updated = row.get("updated")
+        chart = row.get("chart")
+        print(f"rev={rev} status={status} updated={updated} chart={chart}")
+
+
+def cmd_rollback(args):
+    found = find_tool(args.key)
+    if not found:
+        raise SystemExit(f"Unknown tool key: {args.key}")
+
+    _, tool = found
+    ns = args.namespace or tool["namespace"]
+    release = args.release or args.key
+
+    cmd = ["helm", "rollback", release]
+    # If revision is omitted, Helm rolls back to previous revision. [web:641]
+    if args.revision is not None:
+        cmd.append(str(args.revision))
+
+    cmd += ["-n", ns]
+
+    if args.wait:
+        cmd.append("--wait")
+    if args.timeout:
+        cmd += ["--timeout", args.timeout]
+
+    print(f"Rolling back {tool['name']} (release={release}) in namespace '{ns}'...\n")
+    run_cmd(cmd, dry_run=args.dry_run)
+
+
+def register_history_command(subparsers):
+    p = subparsers.add_parser("history", help="Show Helm history for a tool")
+    p.add_argument("key", help="Tool key, e.g. prometheus")
+    p.add_argument("--namespace", help="Override namespace from registry")
+    p.add_argument("--release", help="Override Helm release name (default: same as key)")
+    p.add_argument("--max", type=int, default=10, help="Show last N revisions (default: 10)")
+    p.add_argument("--json", action="store_true", help="Print raw JSON from helm history")
+    p.add_argument("--dry-run", action="store_true", help="Print commands without executing")
+    add_context_args(p)
+    p.set_defaults(func=cmd_history)
+
+
+def register_rollback_command(subparsers):
+    p = subparsers.add_parser("rollback", help="Rollback a Helm release for a tool")
+    p.add_argument("key", help="Tool key, e.g. prometheus")
+    p.add_argument("--revision", type=int, help="Revision number (omit to rollback to previous)")
+    p.add_argument("--namespace", help="Override namespace from registry")
+    p.add_argument("--release", help="Override Helm release name (default: same as key)")
+    p.add_argument("--wait", action="store_true", help="Wait for resources to become ready")
+    p.add_argument("--timeout", help="Helm timeout (e.g. 5m, 2m30s)")
+    p.add_argument("--dry-run", action="store_true", help="Print commands without executing")
+    p.set_defaults(func=cmd_rollback)
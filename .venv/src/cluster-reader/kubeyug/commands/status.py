@@ -0,0 +1,173 @@
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+from kubeyug.registry import find_tool
+from kubeyug.helm_ops import helm_status
+from kubeyug.fanout import (
+    add_context_args, fan_out, print_json, print_table, release_not_found, report_failures, selected_contexts,
+)
+from kubeyug.fleet_status import build_fleet_status, fetch_releases, fetch_tracked_state, release_fingerprint
+
+_FLEET_COLUMNS = [
+    ("KEY", "key"), ("STATUS", "status"), ("NAMESPACE", "namespace"), ("RELEASE", "release"),
+    ("CHART", "chart"), ("VERSION", "version"), ("REVISION", "revision"), ("HELM", "helmStatus"), ("DETAIL", "detail"),
+]
+
+
+def _status_row(context: str, obj: dict) -> dict:
+    meta = (obj.get("chart") or {}).get("metadata") or {}
+    return {
+        "context": context,
+        "name": obj.get("name"),
+        "namespace": obj.get("namespace"),
+        "status": (obj.get("info") or {}).get("status"),
+        "revision": obj.get("version"),
+        "chart": meta.get("version"),
+        "app": meta.get("appVersion"),
+    }
+
+
+def _status_across_contexts(args, contexts: list[str], ns: str):
+    def one(ctx: str, timeout: float) -> dict | None:
+        try:
+            out = helm_status(release=args.key, namespace=ns, kube_context=ctx, timeout=timeout, dry_run=args.dry_run)
+        except subprocess.CalledProcessError as e:
+            if release_not_found(e):
+                return None  # null in --json, "not installed" in the table
+            raise
+        return json.loads(out) if out else {}
+
+    results = fan_out(contexts, one, jobs=args.jobs, timeout=args.context_timeout)
+    if args.json:
+        print_json(results)
+    else:
+        rows = [
+            {"context": r.context, "status": "not installed"} if r.value is None else _status_row(r.context, r.value)
+            for r in results
+            if r.ok and r.value != {}
+        ]
+        print_table(
+            rows,
+            [("CONTEXT", "context"), ("NAMESPACE", "namespace"), ("STATUS", "status"),
+             ("REVISION", "revision"), ("CHART", "chart"), ("APP", "app")],
+        )
+    report_failures(results)
+
+
+def _refresh_tracked(tracked: dict[str, dict], changed: set[tuple[str, str]]) -> None:
+    # Only the releases whose helm revision/status moved get their state re-read (one GET each).
+    from kubeyug.state import get_release
+
+    for ns, name in changed:
+        try:
+            current = get_release(name, ns)
+        except Exception:
+            continue
+        if current and current.get("toolKey"):
+            tracked[current["toolKey"]] = current
+
+
+def _print_json_lines(rows: list[dict]) -> None:
+    stamp = datetime.now().strftime("%H:%M:%S")
+    for r in rows:
+        print(json.dumps(dict(r, observedAt=stamp)))
+    sys.stdout.flush()
+
+
+def _status_all(args):
+    releases = fetch_releases(dry_run=args.dry_run)
+    if args.dry_run:
+        return
+
+    tracked = fetch_tracked_state()
+    rows = build_fleet_status(releases, tracked)
+    if args.json and args.watch:
+        # One object per line from the start, so the whole stream is valid JSON Lines.
+        _print_json_lines(rows)
+    elif args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows, _FLEET_COLUMNS)
+    sys.stdout.flush()
+
+    if not args.watch:
+        return
+
+    prev_fp = release_fingerprint(releases)
+    prev_rows = {r["key"]: r for r in rows}
+    try:
+        while True:
+            time.sleep(args.interval)
+            releases = fetch_releases()
+            fp = release_fingerprint(releases)
+            changed = {k for k in fp.keys() | prev_fp.keys() if fp.get(k) != prev_fp.get(k)}
+            if not changed:
+                continue
+
+            _refresh_tracked(tracked, changed)
+            rows = [r for r in build_fleet_status(releases, tracked) if r != prev_rows.get(r["key"])]
+            prev_fp = fp
+            prev_rows.update({r["key"]: r for r in rows})
+            if not rows:
+                continue
+
+            if args.json:
+                _print_json_lines(rows)
+            else:
+                stamp = datetime.now().strftime("%H:%M:%S")
+                print(f"\n[{stamp}] {len(rows)} change(s)")
+                print_table(rows, _FLEET_COLUMNS)
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_status(args):
+    if args.all:
+        if args.contexts or args.all_contexts:
+            # Tracked state is read through the current kubeconfig context only.
+            raise SystemExit("--all cannot be combined with --contexts/--all-contexts; run it once per context")
+        _status_all(args)
+        return
+    if args.watch:
+        raise SystemExit("--watch is only supported together with --all")
+    if not args.key:
+        raise SystemExit("status needs a tool key, or --all")
+
+    found = find_tool(args.key)
+    if not found:
+        raise SystemExit(f"Unknown tool key: {args.key}")
+
+    _, tool = found
+    ns = args.namespace or tool["namespace"]
+
+    contexts = selected_contexts(args)
+    if contexts is not None:
+        _status_across_contexts(args, contexts, ns)
+        return
+
+    out = helm_status(release=args.key, namespace=ns, dry_run=args.dry_run)
+    if args.json:
+        print(out if out else "{}")
+    else:
+        # keep it simple for now
+        if out:
+            obj = json.loads(out)
+            print(f"Release: {obj.get('name')}  Namespace: {obj.get('namespace')}  Status: {obj.get('info', {}).get('status')}")
+        else:
+            print("dry-run: helm status not executed")
+
+
+def register_status_command(subparsers):
+    p = subparsers.add_parser("status", help="Show Helm status for a tool key")
+    p.add_argument("key", nargs="?", help="tool key, e.g. prometheus")
+    p.add_argument("--all", action="store_true", help="Status of every registry tool from a single helm list")
+    p.add_argument("--watch", action="store_true", help="With --all: keep refreshing, printing only what changed")
+    p.add_argument("--interval", type=float, default=5.0, help="Seconds between --watch refreshes (default: 5)")
+    p.add_argument("--namespace", help="Override namespace from registry")
+    p.add_argument("--json", action="store_true", help="Print raw JSON from helm status")
+    p.add_argument("--dry-run", action="store_true", help="Print command without executing")
+    add_context_args(p)
+    p.set_defaults(func=cmd_status)
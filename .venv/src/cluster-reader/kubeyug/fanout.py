@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from kubeyug import profiling
+from kubeyug.helm_ops import error_text
+
+DEFAULT_JOBS = 8
+DEFAULT_CONTEXT_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class ContextResult:
+    context: str | None
+    ok: bool
+    value: Any = None
+    error: str | None = None
+    seconds: float = 0.0
+
+
+def add_context_args(p) -> None:
+    p.add_argument("--contexts", help="Comma-separated kubeconfig contexts to query concurrently")
+    p.add_argument("--all-contexts", action="store_true", help="Query every context in your kubeconfig")
+    p.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help=f"Max clusters queried at once (default: {DEFAULT_JOBS})")
+    p.add_argument(
+        "--context-timeout",
+        type=float,
+        default=DEFAULT_CONTEXT_TIMEOUT_SECONDS,
+        help=f"Per-cluster timeout in seconds (default: {DEFAULT_CONTEXT_TIMEOUT_SECONDS:.0f})",
+    )
+
+
+def list_kube_contexts() -> list[str]:
+    # kubectl is already a prerequisite and avoids importing the kubernetes client just to read kubeconfig.
+    with profiling.span("kubectl.config"):
+        res = subprocess.run(["kubectl", "config", "get-contexts", "-o", "name"], check=True, text=True, capture_output=True)
+    return [line.strip() for line in res.stdout.splitlines() if line.strip()]
+
+
+def selected_contexts(args) -> list[str] | None:
+    """
+    None means "current context only" (the pre-fan-out behavior).
+    """
+    if getattr(args, "all_contexts", False):
+        contexts = list_kube_contexts()
+        if not contexts:
+            raise SystemExit("No contexts found in kubeconfig.")
+        return contexts
+    if getattr(args, "contexts", None):
+        return [c.strip() for c in args.contexts.split(",") if c.strip()]
+    return None
+
+
+def release_not_found(exc: BaseException) -> bool:
+    # "Error: release: not found" from helm status/history: a normal answer, not an unreachable cluster.
+    return isinstance(exc, subprocess.CalledProcessError) and "release: not found" in (exc.stderr or "")
+
+
+def fan_out(
+    contexts: list[str],
+    fn: Callable[[str, float], Any],
+    *,
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_CONTEXT_TIMEOUT_SECONDS,
+) -> list[ContextResult]:
+    """
+    Run fn(context, timeout) for every context in a bounded pool. fn is expected to honour
+    the timeout (helm/kubectl subprocess timeouts), so one unreachable cluster only costs
+    its own slot. Results keep the order of `contexts`.
+    """
+    # concurrent.futures is only worth importing when we actually fan out.
+    from concurrent.futures import ThreadPoolExecutor
+
+    def one(ctx: str) -> ContextResult:
+        start = time.monotonic()
+        try:
+            value = fn(ctx, timeout)
+            return ContextResult(context=ctx, ok=True, value=value, seconds=time.monotonic() - start)
+        except Exception as e:
+            return ContextResult(context=ctx, ok=False, error=error_text(e), seconds=time.monotonic() - start)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(contexts) or 1))) as pool:
+        return list(pool.map(one, contexts))
+
+
+def print_table(rows: list[dict], columns: list[tuple[str, str]]) -> None:
+    """
+    columns: [(header, row key), ...]
+    """
+    widths = [max([len(h)] + [len(str(r.get(k, "") or "")) for r in rows]) for h, k in columns]
+    print("  ".join(h.ljust(w) for (h, _), w in zip(columns, widths)).rstrip())
+    for r in rows:
+        print("  ".join(str(r.get(k, "") or "").ljust(w) for (_, k), w in zip(columns, widths)).rstrip())
+
+
+def merged_document(results: list[ContextResult]) -> dict:
+    return {
+        "contexts": {r.context: r.value for r in results if r.ok},
+        "errors": {r.context: r.error for r in results if not r.ok},
+    }
+
+
+def print_json(results: list[ContextResult]) -> None:
+    print(json.dumps(merged_document(results), indent=2))
+
+
+def report_failures(results: list[ContextResult]) -> None:
+    failed = [r for r in results if not r.ok]
+    if not failed:
+        return
+    print(f"\n{len(failed)}/{len(results)} context(s) failed:", file=sys.stderr)
+    for r in failed:
+        print(f"  {r.context}: {r.error}", file=sys.stderr)
+    raise SystemExit(1)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import re
+
+from kubeyug.helm_ops import helm_list
+from kubeyug.registry import list_registry_tools
+
+# helm list reports "chart" as "<name>-<version>", e.g. "kube-prometheus-stack-56.6.2".
+_CHART_RE = re.compile(r"^(?P<name>.+?)-(?P<version>v?\d[\w.+-]*)$")
+
+
+def parse_chart(chart: str | None) -> tuple[str | None, str | None]:
+    if not chart:
+        return None, None
+    m = _CHART_RE.match(chart)
+    if not m:
+        return chart, None
+    return m.group("name"), m.group("version")
+
+
+def fetch_releases(*, dry_run: bool = False) -> list[dict]:
+    """
+    Every release in every namespace, any status, from a single helm call.
+    """
+    out = helm_list(all_statuses=True, dry_run=dry_run)
+    return json.loads(out) if out else []
+
+
+def fetch_tracked_state() -> dict[str, dict]:
+    """
+    toolKey -> current state from the kubeyug state store. Missing/unreachable state is not
+    fatal: status then falls back to registry defaults.
+    """
+    try:
+        from kubeyug.state import list_releases
+
+        return {s["toolKey"]: s for s in list_releases() if s.get("toolKey")}
+    except Exception:
+        return {}
+
+
+def _row(tool: dict, tracked: dict | None, releases_by_name: dict[str, list[dict]]) -> dict:
+    key = tool["key"]
+    release = (tracked or {}).get("release") or key
+    expected_ns = (tracked or {}).get("namespace") or tool["namespace"]
+    expected_chart = tool["helm_chart"].split("/")[-1]
+    expected_version = tool.get("version")
+
+    row = {
+        "key": key,
+        "release": release,
+        "expectedNamespace": expected_ns,
+        "namespace": None,
+        "chart": None,
+        "version": None,
+        "revision": None,
+        "helmStatus": None,
+        "status": "missing",
+        "detail": [],
+    }
+
+    candidates = releases_by_name.get(release, [])
+    if not candidates:
+        if tracked and tracked.get("installed"):
+            row["detail"].append("state says installed")
+        return row
+
+    # Prefer the release in the namespace we expect; any other namespace is drift.
+    rel = next((r for r in candidates if r.get("namespace") == expected_ns), candidates[0])
+    chart_name, chart_version = parse_chart(rel.get("chart"))
+    row.update(
+        namespace=rel.get("namespace"),
+        chart=chart_name,
+        version=chart_version,
+        revision=rel.get("revision"),
+        helmStatus=rel.get("status"),
+        status="installed",
+    )
+
+    if rel.get("namespace") != expected_ns:
+        row["detail"].append(f"namespace {rel.get('namespace')} != {expected_ns}")
+    if chart_name and chart_name != expected_chart:
+        row["detail"].append(f"chart {chart_name} != {expected_chart}")
+    if expected_version and chart_version and chart_version.lstrip("v") != str(expected_version).lstrip("v"):
+        row["detail"].append(f"version {chart_version} != {expected_version}")
+    if tracked and not tracked.get("installed"):
+        row["detail"].append("state says uninstalled")
+    if row["detail"]:
+        row["status"] = "drifted"
+
+    return row
+
+
+def build_fleet_status(releases: list[dict], tracked: dict[str, dict]) -> list[dict]:
+    """
+    Join helm releases, the registry and kubeyug state in memory: one row per registry tool.
+    """
+    releases_by_name: dict[str, list[dict]] = {}
+    for rel in releases:
+        releases_by_name.setdefault(rel.get("name"), []).append(rel)
+
+    rows = []
+    for tool in list_registry_tools():
+        row = _row(tool, tracked.get(tool["key"]), releases_by_name)
+        row["category"] = tool.get("category")
+        row["detail"] = "; ".join(row["detail"])
+        rows.append(row)
+    return rows
+
+
+def release_fingerprint(releases: list[dict]) -> dict[tuple[str, str], tuple]:
+    # What has to change before a row is worth recomputing in --watch mode.
+    return {
+        (r.get("namespace"), r.get("name")): (r.get("revision"), r.get("status"), r.get("chart"))
+        for r in releases
+    }
@@ -0,0 +1,166 @@
+import os
+import subprocess
+
+from kubeyug import profiling
+
+
+def _should_print(verbose: bool) -> bool:
+    # Env var lets you turn on logs without changing CLI flags.
+    return verbose or os.getenv("KUBEYUG_VERBOSE") == "1"
+
+
+def run_cmd(
+    cmd: list[str],
+    *,
+    dry_run: bool = False,
+    capture: bool = False,
+    verbose: bool = False,
+    timeout: float | None = None,
+):
+    # Print only if user explicitly asked, or if it's a dry-run (dry-run must show intent).
+    if dry_run or _should_print(verbose):
+        print(">", " ".join(cmd))
+
+    if dry_run:
+        return None
+
+    with profiling.span(".".join(cmd[:2]), argv=" ".join(cmd)):
+        return subprocess.run(cmd, check=True, text=True, capture_output=capture, timeout=timeout)
+
+
+def error_text(exc: BaseException) -> str:
+    """
+    One-line reason for a failed helm/kubectl call (the last stderr line), for result tables.
+    """
+    if isinstance(exc, subprocess.TimeoutExpired):
+        return f"timed out after {exc.timeout:.0f}s"
+    if isinstance(exc, subprocess.CalledProcessError):
+        detail = (exc.stderr or exc.stdout or "").strip()
+        return detail.splitlines()[-1] if detail else f"exit status {exc.returncode}"
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _with_context(cmd: list[str], kube_context: str | None) -> list[str]:
+    return cmd + ["--kube-context", kube_context] if kube_context else cmd
+
+
+def helm_apply_release(
+    *,
+    release: str,
+    chart: str,
+    namespace: str,
+    repo_name: str,
+    repo_url: str,
+    version: str | None = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+):
+    helm_repo_add(name=repo_name, url=repo_url, dry_run=dry_run, verbose=verbose)
+    helm_repo_update([repo_name], dry_run=dry_run, verbose=verbose)
+    helm_upgrade_install(
+        release=release,
+        chart=chart,
+        namespace=namespace,
+        version=version,
+        dry_run=dry_run,
+        verbose=verbose,
+    )
+
+
+def helm_repo_add(*, name: str, url: str, dry_run: bool = False, verbose: bool = False):
+    return run_cmd(["helm", "repo", "add", name, url], dry_run=dry_run, verbose=verbose)
+
+
+def helm_repo_update(names: list[str], *, dry_run: bool = False, verbose: bool = False):
+    # Targeted update: only re-download the indexes we are about to use, not every configured repo.
+    return run_cmd(["helm", "repo", "update", *names], dry_run=dry_run, verbose=verbose)
+
+
+def helm_upgrade_install(
+    *,
+    release: str,
+    chart: str,
+    namespace: str,
+    version: str | None = None,
+    dry_run: bool = False,
+    capture: bool = False,
+    verbose: bool = False,
+):
+    cmd = [
+        "helm",
+        "upgrade",
+        "--install",
+        release,
+        chart,
+        "-n",
+        namespace,
+        "--create-namespace",
+    ]
+    # Registry entries may pin a chart version; unpinned tools track the repo's latest.
+    if version:
+        cmd += ["--version", version]
+
+    return run_cmd(
+        cmd,
+        dry_run=dry_run,
+        capture=capture,
+        verbose=verbose,
+    )
+
+
+def helm_status(
+    *,
+    release: str,
+    namespace: str,
+    kube_context: str | None = None,
+    timeout: float | None = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> str | None:
+    res = run_cmd(
+        _with_context(["helm", "status", release, "-n", namespace, "-o", "json"], kube_context),
+        dry_run=dry_run,
+        capture=True,
+        verbose=verbose,
+        timeout=timeout,
+    )
+    return None if res is None else res.stdout
+
+
+def helm_history(
+    *,
+    release: str,
+    namespace: str,
+    kube_context: str | None = None,
+    timeout: float | None = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> str | None:
+    res = run_cmd(
+        _with_context(["helm", "history", release, "-n", namespace, "-o", "json"], kube_context),
+        dry_run=dry_run,
+        capture=True,
+        verbose=verbose,
+        timeout=timeout,
+    )
+    return None if res is None else res.stdout
+
+
+def helm_list(
+    *,
+    namespace: str | None = None,
+    kube_context: str | None = None,
+    timeout: float | None = None,
+    all_statuses: bool = False,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> str | None:
+    # --max 0: helm otherwise stops at 256 releases without saying so.
+    cmd = ["helm", "list", "-o", "json", "--max", "0"]
+    cmd += ["-n", namespace] if namespace else ["-A"]
+    if all_statuses:
+        # Include failed/pending releases too, not just deployed ones.
+        cmd.append("--all")
+
+    res = run_cmd(_with_context(cmd, kube_context), dry_run=dry_run, capture=True, verbose=verbose, timeout=timeout)
+    return None if res is None else res.stdout
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from kubeyug.helm_ops import error_text, helm_repo_add, helm_repo_update, helm_upgrade_install
+from kubeyug.registry import find_stack, find_tool
+
+
+@dataclass
+class PlannedRelease:
+    key: str
+    tool: dict
+    namespace: str
+    depends_on: list[str] = field(default_factory=list)
+
+
+@dataclass
+class InstallPlan:
+    releases: list[PlannedRelease]
+    # repo name -> repo url, in first-seen order
+    repos: dict[str, str]
+
+
+@dataclass
+class ReleaseResult:
+    key: str
+    status: str  # ok | failed | skipped
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def _expand_targets(targets: list[str]) -> list[str]:
+    keys: list[str] = []
+    for target in targets:
+        stack = find_stack(target)
+        for key in stack if stack is not None else [target]:
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def build_plan(targets: list[str], namespace_override: str | None = None) -> InstallPlan:
+    """
+    Resolve tool keys and named stacks into releases plus the distinct Helm repos they need.
+    depends_on only orders releases that are part of the same plan.
+    """
+    keys = _expand_targets(targets)
+
+    releases: list[PlannedRelease] = []
+    repos: dict[str, str] = {}
+    for key in keys:
+        found = find_tool(key)
+        if not found:
+            raise SystemExit(f"Unknown tool key: {key}")
+        _, tool = found
+
+        repos.setdefault(tool["helm_repo_name"], tool["helm_repo_url"])
+        releases.append(
+            PlannedRelease(
+                key=key,
+                tool=tool,
+                namespace=namespace_override or tool["namespace"],
+                depends_on=[d for d in tool.get("depends_on", []) if d in keys],
+            )
+        )
+
+    _check_acyclic(releases)
+    return InstallPlan(releases=releases, repos=repos)
+
+
+def _check_acyclic(releases: list[PlannedRelease]) -> None:
+    deps = {r.key: r.depends_on for r in releases}
+    done: set[str] = set()
+
+    while len(done) < len(deps):
+        ready = [k for k, d in deps.items() if k not in done and all(x in done for x in d)]
+        if not ready:
+            stuck = sorted(k for k in deps if k not in done)
+            raise SystemExit(f"Dependency cycle between: {', '.join(stuck)}")
+        done.update(ready)
+
+
+def _install_one(release: PlannedRelease, *, dry_run: bool, capture: bool) -> ReleaseResult:
+    # Failed releases are timed too; they are the ones worth looking at in the results table.
+    start = time.monotonic()
+    try:
+        helm_upgrade_install(
+            release=release.key,
+            chart=release.tool["helm_chart"],
+            namespace=release.namespace,
+            version=release.tool.get("version"),
+            dry_run=dry_run,
+            capture=capture,
+        )
+    except Exception as e:
+        return ReleaseResult(key=release.key, status="failed", seconds=time.monotonic() - start, error=error_text(e))
+    return ReleaseResult(key=release.key, status="ok", seconds=time.monotonic() - start)
+
+
+def execute_plan(
+    plan: InstallPlan,
+    *,
+    jobs: int = 4,
+    fail_fast: bool = True,
+    dry_run: bool = False,
+    on_success=None,
+) -> list[ReleaseResult]:
+    """
+    Add/refresh each distinct repo once, then run independent `helm upgrade --install`
+    calls in a bounded pool. on_success(release) runs on the calling thread; if it raises, the
+    release stays "ok" with the error attached.
+    """
+    for name, url in plan.repos.items():
+        helm_repo_add(name=name, url=url, dry_run=dry_run)
+    if plan.repos:
+        helm_repo_update(list(plan.repos), dry_run=dry_run)
+
+    # With several releases in flight, buffer helm output so it does not interleave.
+    capture = len(plan.releases) > 1
+
+    jobs = max(1, jobs)
+    pending = {r.key: r for r in plan.releases}
+    results: dict[str, ReleaseResult] = {}
+    running: dict[Future, PlannedRelease] = {}
+    stop = False
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            # Repeat until nothing new is skipped: a dependent may be listed before the
+            # dependency that was itself just skipped.
+            skipped = True
+            while skipped:
+                skipped = False
+                for key, release in list(pending.items()):
+                    if any(results[d].status in ("failed", "skipped") for d in release.depends_on if d in results):
+                        results[key] = ReleaseResult(key=key, status="skipped", error="dependency failed")
+                        del pending[key]
+                        skipped = True
+
+            if not stop:
+                for key, release in list(pending.items()):
+                    # Submit no more than the pool can run, so fail-fast has nothing queued to cancel.
+                    if len(running) >= jobs:
+                        break
+                    if all(d in results and results[d].status == "ok" for d in release.depends_on):
+                        running[pool.submit(_install_one, release, dry_run=dry_run, capture=capture)] = release
+                        del pending[key]
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                release = running.pop(fut)
+                result = results[release.key] = fut.result()
+                if result.status == "failed":
+                    stop = stop or fail_fast
+                    continue
+
+                if on_success is not None:
+                    try:
+                        on_success(release)
+                    except Exception as e:
+                        # The release is installed; a failed follow-up (e.g. the state write) must not
+                        # abort the rest of the plan or hide the results table.
+                        result.error = f"installed, but post-install step failed: {error_text(e)}"
+
+    for key in pending:
+        results[key] = ReleaseResult(key=key, status="skipped", error="aborted (fail-fast)")
+
+    return [results[r.key] for r in plan.releases]
+
+
+def print_results(results: list[ReleaseResult]) -> None:
+    width = max((len(r.key) for r in results), default=0)
+    for r in results:
+        line = f"{r.key:<{width}}  {r.status:<7}  {r.seconds:6.1f}s"
+        if r.error:
+            line += f"  {r.error}"
+        print(line)
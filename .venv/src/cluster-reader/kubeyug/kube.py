@@ -0,0 +1,248 @@
+from kubernetes import client, config
+from kubernetes.utils.quantity import parse_quantity
+from pathlib import Path
+from platformdirs import user_cache_dir
+import json
+import os
+import time
+
+from kubeyug import profiling
+
+NAMESPACE = "kubeyug"
+CAPS_LABEL_SELECTOR = "app=kubeyug-node-capabilities"
+
+PAGE_SIZE = int(os.getenv("KUBEYUG_LIST_PAGE_SIZE", "200"))
+# How long a cluster summary is reused without re-reading nodes (0 = always re-read).
+# Time-based because the list resourceVersion is cluster-wide: lease and Event writes bump it
+# every few seconds, so it never matches on a live cluster.
+ROLLUP_MAX_AGE_SECONDS = float(os.getenv("KUBEYUG_ROLLUP_MAX_AGE_SECONDS", "30"))
+
+_ROLLUP_CACHE_PATH = Path(user_cache_dir("kubeyug")) / "cluster_rollup.json"
+
+_CORE_V1: client.CoreV1Api | None = None
+
+
+def _core_v1() -> client.CoreV1Api:
+    global _CORE_V1
+    if _CORE_V1 is None:
+        config.load_kube_config()
+        _CORE_V1 = profiling.instrument(client.CoreV1Api())
+    return _CORE_V1
+
+
+def node_capabilities(node) -> dict:
+    """
+    The capabilities.json schema: written per node by agent.py, and computed directly from
+    nodes here when no agent ConfigMaps exist yet.
+    """
+    info = node.status.node_info
+    meta = node.metadata
+    labels = meta.labels or {}
+    capacity = node.status.capacity or {}
+    return {
+        "nodeName": meta.name,
+        "arch": labels.get("kubernetes.io/arch"),
+        "os": labels.get("kubernetes.io/os"),
+        "kernel": info.kernel_version,
+        "kubeletVersion": info.kubelet_version,
+        "capacity": {
+            "cpu": capacity.get("cpu"),
+            "memory": capacity.get("memory"),
+        },
+    }
+
+
+def _paged(list_fn, **kwargs):
+    """
+    Yield items page by page using limit/continue, so we never hold the whole list.
+    Every page of one paginated list is served from the same snapshot.
+    """
+    token = None
+    while True:
+        page = list_fn(limit=PAGE_SIZE, _continue=token, **kwargs)
+        yield from page.items
+        token = page.metadata._continue
+        if not token:
+            return
+
+
+def _iter_configmap_caps(v1):
+    for cm in _paged(v1.list_namespaced_config_map, namespace=NAMESPACE, label_selector=CAPS_LABEL_SELECTOR):
+        data = (cm.data or {}).get("capabilities.json")
+        if data:
+            yield json.loads(data)
+
+
+def _iter_node_caps(v1):
+    for node in _paged(v1.list_node):
+        yield node_capabilities(node)
+
+
+def iter_cluster_capabilities():
+    """
+    Preferred source: ConfigMaps written by agent.py (label app=kubeyug-node-capabilities).
+    Fallback: if none exist, query nodes directly. Yields one caps dict at a time.
+    """
+    v1 = _core_v1()
+
+    found = False
+    for caps in _iter_configmap_caps(v1):
+        found = True
+        yield caps
+
+    # Fallback path: no agent ConfigMaps yet
+    if not found:
+        for caps in _iter_node_caps(v1):
+            yield caps
+
+
+def load_cluster_capabilities():
+    return list(iter_cluster_capabilities())
+
+
+def _profile_hint(name: str) -> str | None:
+    n = name.lower()
+    if n == "minikube" or n.startswith("minikube"):
+        return "minikube"
+    if "kind-control-plane" in n or n.startswith("kind-"):
+        return "kind"
+    if n.startswith("ip-"):  # common on EKS/EC2
+        return "eks"
+    return None
+
+
+_PROFILE_PRIORITY = ("minikube", "kind", "eks")
+
+
+def detect_cluster_profile(caps: list[dict]) -> str:
+    """
+    Returns: minikube | kind | eks | generic
+    Uses only fields already present in caps (nodeName, etc.).
+    """
+    hints = {_profile_hint(str(c.get("nodeName", ""))) for c in caps}
+    return next((p for p in _PROFILE_PRIORITY if p in hints), "generic")
+
+
+def _quantity(value) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(parse_quantity(value))
+    except (ValueError, TypeError):
+        return None
+
+
+class ClusterSummaryBuilder:
+    """
+    Folds node capabilities into the cluster summary one node at a time.
+    CPU and memory are parsed as Kubernetes quantities ("3500m", "16Gi", "1.5", ...).
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.arches: set[str] = set()
+        self.oses: set[str] = set()
+        self.cpu_millicores = 0
+        self.memory_bytes = 0
+        self.profile_hints: set[str] = set()
+
+    def add(self, caps: dict) -> None:
+        self.nodes += 1
+        if caps.get("arch"):
+            self.arches.add(caps["arch"])
+        if caps.get("os"):
+            self.oses.add(caps["os"])
+
+        hint = _profile_hint(str(caps.get("nodeName", "")))
+        if hint:
+            self.profile_hints.add(hint)
+
+        capacity = caps.get("capacity") or {}
+        cpu = _quantity(capacity.get("cpu"))
+        if cpu is not None:
+            self.cpu_millicores += round(cpu * 1000)
+        memory = _quantity(capacity.get("memory"))
+        if memory is not None:
+            self.memory_bytes += int(memory)
+
+    def summary(self) -> dict:
+        cpu = self.cpu_millicores / 1000
+        return {
+            "nodes": self.nodes,
+            "arches": sorted(self.arches),
+            "oses": sorted(self.oses),
+            "totalCpu": int(cpu) if cpu.is_integer() else cpu,
+            "totalMemoryGi": round(self.memory_bytes / 2**30, 1),
+            "profile": next((p for p in _PROFILE_PRIORITY if p in self.profile_hints), "generic"),
+        }
+
+
+def summarize_cluster(caps):
+    builder = ClusterSummaryBuilder()
+    for c in caps:
+        builder.add(c)
+    return builder.summary()
+
+
+def _read_rollups() -> dict:
+    try:
+        return json.loads(_ROLLUP_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_rollup(cache_key: str, source: str, summary: dict) -> None:
+    rollups = _read_rollups()
+    rollups[cache_key] = {"source": source, "storedAt": time.time(), "summary": summary}
+    try:
+        _ROLLUP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _ROLLUP_CACHE_PATH.with_name(f"{_ROLLUP_CACHE_PATH.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(rollups), encoding="utf-8")
+        os.replace(tmp, _ROLLUP_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _cached_rollup(cache_key: str) -> dict | None:
+    entry = _read_rollups().get(cache_key)
+    if not entry or ROLLUP_MAX_AGE_SECONDS <= 0:
+        return None
+    if time.time() - float(entry.get("storedAt", 0)) > ROLLUP_MAX_AGE_SECONDS:
+        return None
+    return entry.get("summary")
+
+
+def _fold(v1, iter_caps) -> dict | None:
+    """
+    Stream one source into a summary; None if it has no items.
+    """
+    builder = ClusterSummaryBuilder()
+    for caps in iter_caps(v1):
+        builder.add(caps)
+    return builder.summary() if builder.nodes else None
+
+
+def load_cluster_summary(*, use_cache: bool = True) -> dict:
+    """
+    Streaming, paginated summary of the cluster, reused from the local rollup cache for
+    KUBEYUG_ROLLUP_MAX_AGE_SECONDS without any API request.
+    """
+    v1 = _core_v1()
+    cache_key = v1.api_client.configuration.host
+
+    if use_cache:
+        cached = _cached_rollup(cache_key)
+        if cached is not None:
+            return cached
+
+    source = "configmaps"
+    summary = _fold(v1, _iter_configmap_caps)
+    if summary is None:
+        # Fallback path: no agent ConfigMaps yet
+        source = "nodes"
+        summary = _fold(v1, _iter_node_caps)
+
+    if summary is None:
+        return ClusterSummaryBuilder().summary()
+    _write_rollup(cache_key, source, summary)
+    return summary
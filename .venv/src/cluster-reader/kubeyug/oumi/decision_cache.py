@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_dir
+
+CACHE_ENABLED = os.getenv("KUBEYUG_LLM_CACHE", "1") != "0"
+CACHE_TTL_SECONDS = int(os.getenv("KUBEYUG_LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_MAX_ENTRIES = int(os.getenv("KUBEYUG_LLM_CACHE_MAX_ENTRIES", "256"))
+
+_CACHE_DIR = Path(user_cache_dir("kubeyug")) / "decisions"
+
+
+def _digest(obj: Any) -> str:
+    blob = obj if isinstance(obj, str) else json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def decision_key(
+    *,
+    goal: str,
+    cluster_summary: dict[str, Any],
+    tools: list[dict[str, Any]],
+    prompt: str,
+    model_config: dict[str, Any],
+) -> dict[str, str]:
+    """
+    Cache key parts. The rendered prompt covers template changes; the model config covers
+    model/endpoint/generation params (never the API key).
+    """
+    parts = {
+        "goal": goal,
+        "cluster": _digest(cluster_summary),
+        "tools": _digest(tools),
+        "prompt": _digest(prompt),
+        "model": _digest(model_config),
+    }
+    parts["id"] = _digest(parts)
+    return parts
+
+
+class DecisionCache:
+    """
+    One JSON file per decision. Entries expire after a TTL; when the cache is over
+    capacity the least recently used files (by mtime, bumped on every hit) are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Path = _CACHE_DIR,
+        *,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        enabled: bool = CACHE_ENABLED,
+    ):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+    def _path(self, key: dict[str, str]) -> Path:
+        return self.directory / f"{key['id']}.json"
+
+    def get(self, key: dict[str, str]) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - float(entry.get("storedAt", 0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)  # LRU: mark as recently used
+        except OSError:
+            pass
+        return entry.get("decision")
+
+    def put(self, key: dict[str, str], decision: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"storedAt": time.time(), "key": key, "decision": decision}), encoding="utf-8")
+            os.replace(tmp, path)
+            self._evict()
+        except OSError:
+            # A read-only or full cache dir should never break a decision.
+            pass
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+
+        def mtime(p: Path) -> float:
+            try:
+                return p.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        entries.sort(key=mtime)
+        for p in entries[: len(entries) - self.max_entries]:
+            p.unlink(missing_ok=True)
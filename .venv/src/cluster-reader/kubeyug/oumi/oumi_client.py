@@ -0,0 +1,198 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from kubeyug import profiling
+from kubeyug.oumi.decision_cache import DecisionCache, decision_key
+from kubeyug.oumi.prompts import build_tool_selection_prompt
+
+
+@dataclass
+class OumiClientConfig:
+    """
+    Minimal config for an OpenAI-compatible endpoint (could be OpenAI, vLLM OpenAI server, etc.).
+    Read from env so the CLI remains self-contained.
+    """
+    model: str = os.getenv("KUBEYUG_LLM_MODEL", "gpt-4o-mini")
+    base_url: str | None = os.getenv("KUBEYUG_LLM_BASE_URL")
+    api_key: str | None = os.getenv("KUBEYUG_LLM_API_KEY")
+
+    max_new_tokens: int = int(os.getenv("KUBEYUG_LLM_MAX_NEW_TOKENS", "256"))
+    temperature: float = float(os.getenv("KUBEYUG_LLM_TEMPERATURE", "0.1"))
+
+    def cache_identity(self) -> dict[str, Any]:
+        # Everything that can change the model's answer; the API key deliberately is not part of it.
+        d = asdict(self)
+        d.pop("api_key", None)
+        return d
+
+
+@dataclass
+class DecisionStats:
+    cache_hits: int = 0
+    cache_misses: int = 0
+    infer_calls: int = 0
+    infer_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+class OumiClient:
+    def __init__(self, cfg: OumiClientConfig | None = None, cache: DecisionCache | None = None):
+        self.cfg = cfg or OumiClientConfig()
+        self.cache = cache or DecisionCache()
+        self.stats = DecisionStats()
+        self._engine = None
+        self._infer_cfg = None
+
+    def _ensure_engine(self):
+        # Importing oumi and building the engine costs seconds; cache hits never get here.
+        if self._engine is not None:
+            return self._engine, self._infer_cfg
+
+        from oumi.core.configs import InferenceConfig, ModelParams, GenerationParams, RemoteParams
+        from oumi.inference import OpenAIInferenceEngine
+
+        model_params = ModelParams(
+            model_name=self.cfg.model,
+            model_kwargs={},
+        )
+
+        gen_params = GenerationParams(
+            max_new_tokens=self.cfg.max_new_tokens,
+            temperature=self.cfg.temperature,
+        )
+
+        self._engine = OpenAIInferenceEngine(
+            model_params=model_params,
+            generation_params=gen_params,
+            remote_params=RemoteParams(
+                api_key=self.cfg.api_key,
+                api_url=self.cfg.base_url,
+            ),
+        )
+
+        self._infer_cfg = InferenceConfig(
+            model=model_params,
+            generation=gen_params,
+        )
+        return self._engine, self._infer_cfg
+
+    def decide(self, goal: str, cluster_summary: dict[str, Any], tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Returns:
+          {"chartKey": "<tool key>", "reason": "...", "confidence": 0..1}
+        """
+        return self.decide_many(cluster_summary, {goal: tools})[goal]
+
+    def decide_many(self, cluster_summary: dict[str, Any], tools_by_goal: dict[str, list[dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+        """
+        Resolve several goals at once (e.g. monitoring, logging, gitops, security).
+        Cached decisions are served from disk; all misses go to the model in a single infer call.
+        """
+        with profiling.span("llm.decide", goals=len(tools_by_goal)):
+            return self._decide_many(cluster_summary, tools_by_goal)
+
+    def _decide_many(self, cluster_summary: dict[str, Any], tools_by_goal: dict[str, list[dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+        start = time.perf_counter()
+        model_identity = self.cfg.cache_identity()
+
+        decisions: dict[str, dict[str, Any]] = {}
+        misses: list[tuple[str, str, dict[str, str]]] = []
+        for goal, tools in tools_by_goal.items():
+            prompt = self._build_prompt(goal, cluster_summary, tools)
+            key = decision_key(
+                goal=goal,
+                cluster_summary=cluster_summary,
+                tools=tools,
+                prompt=prompt,
+                model_config=model_identity,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                decisions[goal] = cached
+            else:
+                self.stats.cache_misses += 1
+                misses.append((goal, prompt, key))
+
+        if misses:
+            from oumi.core.types import Conversation, Message, Role
+
+            engine, infer_cfg = self._ensure_engine()
+            convos = [Conversation(messages=[Message(role=Role.USER, content=prompt)]) for _, prompt, _ in misses]
+
+            infer_start = time.perf_counter()
+            with profiling.span("llm.infer", conversations=len(convos), model=self.cfg.model):
+                out = engine.infer(convos, infer_cfg)
+            self.stats.infer_calls += 1
+            self.stats.infer_ms += (time.perf_counter() - infer_start) * 1000
+
+            for (goal, _, key), convo in zip(misses, out):
+                text = convo.messages[-1].content
+                decision = self._parse_or_fallback(text, tools_by_goal[goal])
+                # Fallbacks mean the model misbehaved; don't pin them for the whole TTL.
+                if decision.get("confidence", 0.0) > 0.0:
+                    self.cache.put(key, decision)
+                decisions[goal] = decision
+
+        self.stats.total_ms += (time.perf_counter() - start) * 1000
+        return {goal: decisions[goal] for goal in tools_by_goal}
+
+    def _build_prompt(self, goal: str, cluster_summary: dict[str, Any], tools: list[dict[str, Any]]) -> str:
+        return build_tool_selection_prompt(
+            goal=goal,
+            cluster_summary=cluster_summary,
+            tools=tools,
+            max_reason_sentences=2,
+        )
+
+    def _parse_or_fallback(self, model_text: str, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Robust JSON extraction:
+        - Try parse whole output
+        - Else extract first {...} block
+        - Validate chartKey is in registry tool keys
+        """
+        tool_keys = [t.get("key") for t in tools if t.get("key")]
+        tool_key_set = set(tool_keys)
+
+        obj = None
+        try:
+            obj = json.loads(model_text)
+        except Exception:
+            start = model_text.find("{")
+            end = model_text.rfind("}")
+            if start != -1 and end != -1 and end > start:
+                try:
+                    obj = json.loads(model_text[start : end + 1])
+                except Exception:
+                    obj = None
+
+        if not isinstance(obj, dict):
+            return {
+                "chartKey": tool_keys[0] if tool_keys else None,
+                "reason": "LLM output was not valid JSON; using fallback.",
+                "confidence": 0.0,
+            }
+
+        chart_key = obj.get("chartKey")
+        if chart_key not in tool_key_set:
+            return {
+                "chartKey": tool_keys[0] if tool_keys else None,
+                "reason": "LLM returned an unknown tool key; using fallback.",
+                "confidence": 0.0,
+            }
+
+        conf = obj.get("confidence", 0.5)
+        try:
+            conf_f = float(conf)
+        except Exception:
+            conf_f = 0.5
+
+        return {
+            "chartKey": chart_key,
+            "reason": str(obj.get("reason", ""))[:400],
+            "confidence": max(0.0, min(1.0, conf_f)),
+        }
@@ -0,0 +1,163 @@
+"""
+Lightweight span recorder behind `kubeyug --profile` / KUBEYUG_PROFILE=1.
+
+When profiling is off, span() returns a shared no-op context manager and instrument() returns
+the object unchanged, so instrumented code paths cost (almost) nothing.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+_NOOP = nullcontext()
+
+_enabled = os.getenv("KUBEYUG_PROFILE", "0") not in ("", "0")
+_out_path = os.getenv("KUBEYUG_PROFILE_OUT")
+# Long-running processes (the agent) would otherwise grow the trace forever; per-name totals
+# keep counting past the cap.
+MAX_SPANS = int(os.getenv("KUBEYUG_PROFILE_MAX_SPANS", "10000"))
+_t0 = time.perf_counter()
+_spans: list[dict] = []
+_totals: dict[str, dict] = {}
+_dropped = 0
+_lock = threading.Lock()
+_registered = False
+
+
+def enable(out_path: str | None = None, *, emit_at_exit: bool = True) -> None:
+    global _enabled, _out_path
+    _enabled = True
+    _out_path = out_path or _out_path
+    if emit_at_exit:
+        _register_exit_hook()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "start")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        rec = {
+            "name": self.name,
+            "startMs": round((self.start - _t0) * 1000, 3),
+            "durationMs": round((end - self.start) * 1000, 3),
+            "thread": threading.current_thread().name,
+        }
+        if self.attrs:
+            rec["attrs"] = self.attrs
+        if exc_type is not None:
+            rec["error"] = exc_type.__name__
+        _record(rec)
+        return False
+
+
+def _record(rec: dict) -> None:
+    global _dropped
+    with _lock:
+        agg = _totals.setdefault(rec["name"], {"count": 0, "totalMs": 0.0, "maxMs": 0.0})
+        agg["count"] += 1
+        agg["totalMs"] += rec["durationMs"]
+        agg["maxMs"] = max(agg["maxMs"], rec["durationMs"])
+        if len(_spans) < MAX_SPANS:
+            _spans.append(rec)
+        else:
+            _dropped += 1
+
+
+def span(name: str, **attrs):
+    if not _enabled:
+        return _NOOP
+    return _Span(name, attrs)
+
+
+class _InstrumentedApi:
+    """
+    Proxy that wraps every public method call of a Kubernetes API object in a span.
+    """
+
+    def __init__(self, api, prefix: str):
+        self._api = api
+        self._prefix = prefix
+
+    def __getattr__(self, attr):
+        value = getattr(self._api, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+
+        # wraps() keeps __doc__: kubernetes.watch.Watch reads the ":return:" line from it to
+        # know what to deserialize events into.
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            with span(f"{self._prefix}.{attr}"):
+                return value(*args, **kwargs)
+
+        return call
+
+
+def instrument(api, prefix: str = "k8s"):
+    return _InstrumentedApi(api, prefix) if _enabled else api
+
+
+def summary() -> dict:
+    with _lock:
+        spans = list(_spans)
+        by_name = {name: {**agg, "totalMs": round(agg["totalMs"], 3)} for name, agg in _totals.items()}
+        dropped = _dropped
+
+    doc = {
+        "wallMs": round((time.perf_counter() - _t0) * 1000, 3),
+        "summary": dict(sorted(by_name.items(), key=lambda kv: -kv[1]["totalMs"])),
+        "spans": spans,
+    }
+    if dropped:
+        doc["droppedSpans"] = dropped
+    return doc
+
+
+def reset() -> None:
+    global _t0, _dropped
+    with _lock:
+        _spans.clear()
+        _totals.clear()
+        _dropped = 0
+    _t0 = time.perf_counter()
+
+
+def emit() -> None:
+    if not _enabled:
+        return
+    doc = json.dumps(summary(), indent=2)
+    if _out_path:
+        with open(_out_path, "w", encoding="utf-8") as f:
+            f.write(doc)
+    else:
+        print(doc, file=sys.stderr)
+
+
+def _register_exit_hook() -> None:
+    global _registered
+    if not _registered:
+        atexit.register(emit)
+        _registered = True
+
+
+if _enabled:
+    _register_exit_hook()
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from platformdirs import user_cache_dir
+
+from kubeyug import profiling
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(HERE), "data")
+PACKAGED_TOOL_REGISTRY_PATH = os.path.join(DATA_DIR, "tool_registry.json")
+
+DEFAULT_TTL_SECONDS = int(os.getenv("KUBEYUG_REGISTRY_TTL_SECONDS", str(24 * 3600)))
+REGISTRY_URL = os.getenv("KUBEYUG_REGISTRY_URL")
+# Set to 0 to only refresh via `kubeyug registry refresh` (e.g. in locked-down automation).
+BACKGROUND_REFRESH = os.getenv("KUBEYUG_REGISTRY_BACKGROUND_REFRESH", "1") != "0"
+
+_APP_NAME = "kubeyug"
+_CACHE_DIR = Path(user_cache_dir(_APP_NAME))
+_CACHE_REGISTRY_PATH = _CACHE_DIR / "tool_registry.json"
+_CACHE_META_PATH = _CACHE_DIR / "tool_registry.meta.json"
+_CACHE_INDEX_PATH = _CACHE_DIR / "tool_registry.index.pickle"
+_PACKAGED_INDEX_PATH = _CACHE_DIR / "tool_registry.packaged.index.pickle"
+_REFRESH_LOCK_PATH = _CACHE_DIR / "tool_registry.refresh.lock"
+_REFRESH_LOCK_STALE_SECONDS = 60
+# After a failed fetch, wait this long (doubling per consecutive failure, capped at the TTL)
+# before a background refresh is attempted again.
+_REFRESH_RETRY_SECONDS = 300
+
+# Top-level registry key holding named stacks ({"<stack>": ["<tool key>", ...]}); every other key is a category.
+STACKS_KEY = "stacks"
+
+# Bump when RegistryIndex changes shape so old pickles are rebuilt.
+_INDEX_FORMAT = 1
+
+_REGISTRY_INDEX: RegistryIndex | None = None
+
+
+class RegistryRefreshError(RuntimeError):
+    pass
+
+
+@dataclass
+class _CacheMeta:
+    fetched_at: float | None = None
+    etag: str | None = None
+    last_attempt_at: float | None = None
+    failures: int = 0
+
+    @staticmethod
+    def load(path: Path) -> "_CacheMeta":
+        if not path.exists():
+            return _CacheMeta()
+        try:
+            obj = json.loads(path.read_text(encoding="utf-8"))
+            return _CacheMeta(
+                fetched_at=float(obj.get("fetchedAt")) if obj.get("fetchedAt") is not None else None,
+                etag=str(obj.get("etag")) if obj.get("etag") else None,
+                last_attempt_at=float(obj["lastAttemptAt"]) if obj.get("lastAttemptAt") is not None else None,
+                failures=int(obj.get("failures") or 0),
+            )
+        except Exception:
+            return _CacheMeta()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "fetchedAt": self.fetched_at,
+            "etag": self.etag,
+            "lastAttemptAt": self.last_attempt_at,
+            "failures": self.failures,
+        }
+        _atomic_write(path, json.dumps(doc, indent=2).encode("utf-8"))
+
+
+def _iter_categories(reg: dict[str, Any]):
+    for category, tools in reg.items():
+        if category == STACKS_KEY:
+            continue
+        yield category, tools
+
+
+_REQUIRED_TOOL_FIELDS = ("key", "name", "helm_repo_name", "helm_repo_url", "helm_chart", "namespace")
+
+
+def validate_registry(reg: dict[str, Any]) -> None:
+    """
+    Fail fast on a malformed registry; runs when an index is (re)built, not on every start.
+    """
+    if not isinstance(reg, dict):
+        raise SystemExit("Invalid tool registry: expected a JSON object of categories.")
+
+    for category, tools in _iter_categories(reg):
+        if not isinstance(tools, list):
+            raise SystemExit(f"Invalid tool registry: category '{category}' must be a list.")
+        for t in tools:
+            if not isinstance(t, dict):
+                raise SystemExit(f"Invalid tool registry: every tool in '{category}' must be an object.")
+            missing = [f for f in _REQUIRED_TOOL_FIELDS if not t.get(f)]
+            if missing:
+                raise SystemExit(
+                    f"Invalid tool registry: tool '{t.get('key', '?')}' in '{category}' is missing {', '.join(missing)}."
+                )
+            if not isinstance(t["key"], str):
+                raise SystemExit(f"Invalid tool registry: tool key in '{category}' must be a string.")
+            if not _is_str_list(t.get("depends_on", [])):
+                raise SystemExit(f"Invalid tool registry: depends_on of '{t['key']}' must be a list of tool keys.")
+
+    stacks = reg.get(STACKS_KEY) or {}
+    if not isinstance(stacks, dict) or not all(_is_str_list(keys) for keys in stacks.values()):
+        raise SystemExit(f"Invalid tool registry: '{STACKS_KEY}' must map stack names to lists of tool keys.")
+
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+@dataclass
+class RegistryIndex:
+    """
+    Precompiled view of the registry: every lookup is a dict access instead of a scan.
+    """
+    registry: dict[str, Any]
+    tools: dict[str, tuple[str, dict]] = field(default_factory=dict)  # key -> (category, tool)
+    categories: dict[str, list[str]] = field(default_factory=dict)  # category -> keys
+    repos: dict[str, list[str]] = field(default_factory=dict)  # helm repo name -> keys
+    stacks: dict[str, list[str]] = field(default_factory=dict)  # stack name -> keys
+
+    @staticmethod
+    def build(reg: dict[str, Any]) -> "RegistryIndex":
+        validate_registry(reg)
+        idx = RegistryIndex(registry=reg)
+
+        for category, tools in _iter_categories(reg):
+            keys = idx.categories.setdefault(category, [])
+            for t in tools:
+                key = t["key"]
+                if key in idx.tools:
+                    raise SystemExit(f"Invalid tool registry: duplicate tool key '{key}'.")
+                idx.tools[key] = (category, t)
+                keys.append(key)
+                idx.repos.setdefault(t["helm_repo_name"], []).append(key)
+
+        for key, (_, t) in idx.tools.items():
+            unknown = [d for d in t.get("depends_on", []) if d not in idx.tools]
+            if unknown:
+                raise SystemExit(f"Invalid tool registry: '{key}' depends on unknown {', '.join(unknown)}.")
+
+        for name, keys in (reg.get(STACKS_KEY) or {}).items():
+            unknown = [k for k in keys if k not in idx.tools]
+            if unknown:
+                raise SystemExit(f"Invalid tool registry: stack '{name}' references unknown {', '.join(unknown)}.")
+            idx.stacks[name] = list(keys)
+
+        return idx
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    # Readers in other kubeyug processes must never see a half-written file.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _sha256(data: bytes) -> str:
+    # hashlib loads OpenSSL; only needed when the registry changed on disk.
+    import hashlib
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def _index_header(source: Path, st: os.stat_result, digest: str) -> dict[str, Any]:
+    return {
+        "format": _INDEX_FORMAT,
+        "source": str(source),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha256": digest,
+    }
+
+
+def _read_index_file(path: Path) -> tuple[dict[str, Any], RegistryIndex] | None:
+    try:
+        with path.open("rb") as f:
+            header, idx = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(header, dict) or header.get("format") != _INDEX_FORMAT:
+        return None
+    return header, idx
+
+
+def _write_index_file(path: Path, header: dict[str, Any], idx: RegistryIndex) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, pickle.dumps((header, idx), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        # Read-only cache dir: still works, just re-parses next time.
+        pass
+
+
+def _load_index(source: Path, index_path: Path) -> RegistryIndex:
+    """
+    Load the persisted index for `source`, rebuilding it only if the registry content changed.
+    A matching mtime/size skips reading the JSON entirely; otherwise the content hash decides.
+    """
+    st = source.stat()
+    cached = _read_index_file(index_path)
+    if cached is not None:
+        header, idx = cached
+        if (header.get("source"), header.get("mtime_ns"), header.get("size")) == (str(source), st.st_mtime_ns, st.st_size):
+            return idx
+
+    raw = source.read_bytes()
+    digest = _sha256(raw)
+    if cached is not None and cached[0].get("sha256") == digest:
+        idx = cached[1]
+    else:
+        idx = RegistryIndex.build(json.loads(raw))
+
+    _write_index_file(index_path, _index_header(source, st, digest), idx)
+    return idx
+
+
+def _in_retry_backoff(meta: _CacheMeta) -> bool:
+    if not meta.failures or meta.last_attempt_at is None:
+        return False
+    wait = min(_REFRESH_RETRY_SECONDS * 2 ** (meta.failures - 1), DEFAULT_TTL_SECONDS)
+    return (time.time() - meta.last_attempt_at) < wait
+
+
+def _should_refresh(meta: _CacheMeta) -> bool:
+    if meta.fetched_at is None:
+        return True
+    return (time.time() - meta.fetched_at) > DEFAULT_TTL_SECONDS
+
+
+def _http_fetch_registry(url: str, meta: _CacheMeta) -> tuple[bytes | None, str | None]:
+    """
+    Returns: (registry_body_or_none_if_304, new_etag_or_none)
+    """
+    # urllib.request pulls in http/email/ssl; only pay for it when we actually fetch.
+    import urllib.error
+    import urllib.request
+
+    headers = {
+        "Accept": "application/json",
+        "User-Agent": "kubeyug/0.1",
+    }
+    if meta.etag:
+        headers["If-None-Match"] = meta.etag
+
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            status = getattr(resp, "status", 200)
+            if status == 304:
+                return None, meta.etag
+            body = resp.read()
+            new_etag = resp.headers.get("ETag")
+            return body, new_etag
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, meta.etag
+        raise
+
+
+def refresh_registry_cache(*, force: bool = False) -> bool:
+    """
+    Fetch the remote registry (conditional on ETag unless force) and rebuild the cached index.
+    Returns True if the cached registry content changed. A registry that fails validation is
+    never written to the cache. Fetch, decode and validation failures are recorded in the cache
+    meta (so background refreshes back off) and raised as RegistryRefreshError.
+    """
+    if not REGISTRY_URL:
+        return False
+
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    meta = _CacheMeta.load(_CACHE_META_PATH)
+    if force:
+        meta.etag = None
+
+    # Loaded by urllib.request anyway; needed here for IncompleteRead & co.
+    import http.client
+
+    meta.last_attempt_at = time.time()
+    try:
+        with profiling.span("registry.fetch"):
+            body, new_etag = _http_fetch_registry(REGISTRY_URL, meta)
+        idx = RegistryIndex.build(json.loads(body)) if body is not None else None
+    except (OSError, http.client.HTTPException, ValueError, SystemExit) as e:
+        # urllib's URLError/HTTPError are OSErrors; bad JSON is a ValueError; validation exits.
+        meta.failures += 1
+        meta.save(_CACHE_META_PATH)
+        detail = e if hasattr(e, "code") else (getattr(e, "reason", None) or e)
+        raise RegistryRefreshError(f"{REGISTRY_URL}: {detail}") from e
+
+    changed = False
+    if idx is not None:
+        _atomic_write(_CACHE_REGISTRY_PATH, body)
+        st = _CACHE_REGISTRY_PATH.stat()
+        _write_index_file(_CACHE_INDEX_PATH, _index_header(_CACHE_REGISTRY_PATH, st, _sha256(body)), idx)
+        meta.etag = new_etag
+        changed = True
+
+    meta.fetched_at = meta.last_attempt_at
+    meta.failures = 0
+    meta.save(_CACHE_META_PATH)
+    return changed
+
+
+def _acquire_refresh_lock() -> bool:
+    try:
+        fd = os.open(_REFRESH_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - _REFRESH_LOCK_PATH.stat().st_mtime < _REFRESH_LOCK_STALE_SECONDS:
+                return False
+            _REFRESH_LOCK_PATH.unlink()
+        except OSError:
+            return False
+        return _acquire_refresh_lock()
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+def _background_refresh_main() -> None:
+    # Entry point of the detached refresher process; it owns (and releases) the lock.
+    try:
+        refresh_registry_cache()
+    except Exception:
+        pass
+    finally:
+        try:
+            _REFRESH_LOCK_PATH.unlink()
+        except OSError:
+            pass
+
+
+def _schedule_background_refresh() -> None:
+    """
+    Stale-while-revalidate: commands keep using whatever registry is on disk and a detached
+    process refreshes the cache for the next invocation. Nothing here waits on the network.
+    """
+    if not REGISTRY_URL or not BACKGROUND_REFRESH:
+        return
+
+    meta = _CacheMeta.load(_CACHE_META_PATH)
+    if _in_retry_backoff(meta):
+        return  # the endpoint failed recently; don't spawn a refresher on every command
+    if _CACHE_REGISTRY_PATH.exists() and not _should_refresh(meta):
+        return
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    if not _acquire_refresh_lock():
+        return  # another kubeyug process is already refreshing
+
+    env = dict(os.environ)
+    # The refresher outlives this command; its own profile would overwrite this command's trace.
+    for name in ("KUBEYUG_PROFILE", "KUBEYUG_PROFILE_OUT"):
+        env.pop(name, None)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (os.path.dirname(HERE), env.get("PYTHONPATH")) if p)
+    try:
+        subprocess.Popen(
+            [sys.executable, "-c", "from kubeyug.registry import _background_refresh_main; _background_refresh_main()"],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        _REFRESH_LOCK_PATH.unlink(missing_ok=True)
+
+
+def load_registry_index() -> RegistryIndex:
+    global _REGISTRY_INDEX
+    if _REGISTRY_INDEX is not None:
+        return _REGISTRY_INDEX
+
+    with profiling.span("registry.load"):
+        _schedule_background_refresh()
+
+        if _CACHE_REGISTRY_PATH.exists():
+            _REGISTRY_INDEX = _load_index(_CACHE_REGISTRY_PATH, _CACHE_INDEX_PATH)
+        else:
+            _REGISTRY_INDEX = _load_index(Path(PACKAGED_TOOL_REGISTRY_PATH), _PACKAGED_INDEX_PATH)
+    return _REGISTRY_INDEX
+
+
+def load_tool_registry() -> dict[str, Any]:
+    return load_registry_index().registry
+
+
+def find_tool(key: str) -> tuple[str, dict] | None:
+    return load_registry_index().tools.get(key)
+
+
+def find_stack(name: str) -> list[str] | None:
+    stack = load_registry_index().stacks.get(name)
+    return list(stack) if stack is not None else None
+
+
+def tools_in_category(category: str) -> list[dict]:
+    idx = load_registry_index()
+    return [idx.tools[k][1] for k in idx.categories.get(category, [])]
+
+
+def tools_for_repo(repo_name: str) -> list[dict]:
+    idx = load_registry_index()
+    return [idx.tools[k][1] for k in idx.repos.get(repo_name, [])]
+
+
+def list_registry_tools() -> list[dict]:
+    idx = load_registry_index()
+    out: list[dict] = []
+    for category, keys in idx.categories.items():
+        for k in keys:
+            out.append({"category": category, **idx.tools[k][1]})
+    return out
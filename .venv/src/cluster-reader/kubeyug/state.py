@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from kubernetes import client, config
+from kubernetes.client.rest import ApiException
+
+from kubeyug import profiling
+
+STATE_NAMESPACE = "kubeyug"
+
+# Two ConfigMaps per release: the current state, and its bounded event log. Lookups and
+# listings only ever read the (small) state ConfigMaps, never any history.
+RELEASE_CONFIGMAP_PREFIX = "kubeyug-release-"
+EVENTS_CONFIGMAP_PREFIX = "kubeyug-events-"
+RELEASE_LABEL = "app=kubeyug-release-state"
+TOOL_LABEL = "kubeyug.io/tool"
+INSTALLED_LABEL = "kubeyug.io/installed"
+CURRENT_KEY = "current.json"
+EVENTS_KEY = "events.json"
+# Number of events ever appended to a release's log; orders writes of the current state.
+SEQ_KEY = "seq"
+
+MAX_EVENTS = int(os.getenv("KUBEYUG_STATE_MAX_EVENTS", "50"))
+MAX_WRITE_ATTEMPTS = 8
+
+# Original single ConfigMap holding an append-only list of every install event.
+LEGACY_STATE_CONFIGMAP_NAME = "kubeyug-state"
+LEGACY_STATE_KEY = "kubeyug-state.json"
+# Fold a leftover legacy ConfigMap in on first state access (one extra GET per process).
+AUTO_MIGRATE = os.getenv("KUBEYUG_STATE_AUTO_MIGRATE", "1") != "0"
+
+_CORE_V1: client.CoreV1Api | None = None
+_LEGACY_CHECKED = False
+
+
+class StateConflictError(RuntimeError):
+    pass
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _core_v1() -> client.CoreV1Api:
+    # Uses kubeconfig on your dev machine; loaded once per process.
+    global _CORE_V1
+    if _CORE_V1 is None:
+        config.load_kube_config()
+        _CORE_V1 = profiling.instrument(client.CoreV1Api())
+    return _CORE_V1
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def release_configmap_name(release: str, namespace: str) -> str:
+    # Namespaces cannot contain dots, so "<namespace>.<release>" is unambiguous.
+    return f"{RELEASE_CONFIGMAP_PREFIX}{namespace}.{release}"
+
+
+def events_configmap_name(release: str, namespace: str) -> str:
+    return f"{EVENTS_CONFIGMAP_PREFIX}{namespace}.{release}"
+
+
+def _ensure_migrated() -> None:
+    global _LEGACY_CHECKED
+    if _LEGACY_CHECKED or not AUTO_MIGRATE:
+        return
+    _LEGACY_CHECKED = True
+    migrated = migrate_legacy_state()
+    if migrated:
+        # stderr: state is read by commands that print JSON on stdout.
+        print(f"Migrated {migrated} event(s) from the legacy {LEGACY_STATE_CONFIGMAP_NAME} ConfigMap", file=sys.stderr)
+
+
+def _read_release_cm(name: str):
+    try:
+        return _core_v1().read_namespaced_config_map(name, STATE_NAMESPACE)
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+def _current_from_cm(cm) -> dict | None:
+    raw = (cm.data or {}).get(CURRENT_KEY)
+    return json.loads(raw) if raw else None
+
+
+def get_release(release: str, namespace: str) -> dict | None:
+    """
+    Current state of a single release (one GET, independent of history size).
+    """
+    _ensure_migrated()
+    cm = _read_release_cm(release_configmap_name(release, namespace))
+    return None if cm is None else _current_from_cm(cm)
+
+
+def get_release_events(release: str, namespace: str) -> list[dict]:
+    _ensure_migrated()
+    cm = _read_release_cm(events_configmap_name(release, namespace))
+    if cm is None:
+        return []
+    return json.loads((cm.data or {}).get(EVENTS_KEY) or "[]")
+
+
+def list_releases(*, tool_key: str | None = None, installed_only: bool = False) -> list[dict]:
+    """
+    Current state of every tracked release; filtering happens server-side via labels.
+    """
+    _ensure_migrated()
+    selector = [RELEASE_LABEL]
+    if tool_key:
+        selector.append(f"{TOOL_LABEL}={tool_key}")
+    if installed_only:
+        selector.append(f"{INSTALLED_LABEL}=true")
+
+    cms = _core_v1().list_namespaced_config_map(
+        namespace=STATE_NAMESPACE,
+        label_selector=",".join(selector),
+    ).items
+
+    out = []
+    for cm in cms:
+        current = _current_from_cm(cm)
+        if current:
+            out.append(current)
+    return out
+
+
+def _append_event(events: list[dict], event: dict) -> list[dict]:
+    # Compact repeated identical actions (e.g. re-running the same upgrade) into one entry.
+    last = events[-1] if events else None
+    if last and last.get("action") == event["action"] and last.get("chart") == event.get("chart"):
+        merged = dict(last, timestamp=event["timestamp"], count=int(last.get("count", 1)) + int(event.get("count", 1)))
+        events = events[:-1] + [merged]
+    else:
+        events = events + [event]
+    return events[-MAX_EVENTS:]
+
+
+def _state_labels(current: dict) -> dict[str, str]:
+    return {
+        "app": "kubeyug-release-state",
+        TOOL_LABEL: current["toolKey"],
+        INSTALLED_LABEL: "true" if current["installed"] else "false",
+    }
+
+
+def _configmap_body(name: str, labels: dict[str, str], data: dict[str, str], resource_version: str | None):
+    return client.V1ConfigMap(
+        metadata=client.V1ObjectMeta(
+            name=name, namespace=STATE_NAMESPACE, labels=labels, resource_version=resource_version
+        ),
+        data=data,
+    )
+
+
+def _write_cm(cm, body) -> bool:
+    """
+    Create or replace (guarded by the resourceVersion we read). False on a 409.
+    """
+    v1 = _core_v1()
+    try:
+        if cm is None:
+            v1.create_namespaced_config_map(namespace=STATE_NAMESPACE, body=body)
+        else:
+            v1.replace_namespaced_config_map(name=body.metadata.name, namespace=STATE_NAMESPACE, body=body)
+        return True
+    except ApiException as e:
+        # 409 = someone else created/updated it since our read.
+        if e.status != 409:
+            raise
+        return False
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+
+
+def _update_release(release: str, namespace: str, apply_events) -> dict:
+    """
+    Read-modify-write of a release's event log, then of its current state, both with
+    resourceVersion optimistic concurrency. apply_events(events) -> (current, events).
+    A concurrent writer causes a 409; we re-read and retry instead of overwriting its change.
+    """
+    name = events_configmap_name(release, namespace)
+    for attempt in range(MAX_WRITE_ATTEMPTS):
+        cm = _read_release_cm(name)
+        data = (cm.data or {}) if cm is not None else {}
+        current, events = apply_events(json.loads(data.get(EVENTS_KEY) or "[]"))
+        seq = int(data.get(SEQ_KEY) or 0) + 1
+
+        rv = cm.metadata.resource_version if cm is not None else None
+        body = _configmap_body(name, {"app": "kubeyug-release-events", TOOL_LABEL: current["toolKey"]}, {EVENTS_KEY: _dumps(events), SEQ_KEY: str(seq)}, rv)
+        if _write_cm(cm, body):
+            break
+        _backoff(attempt)
+    else:
+        raise StateConflictError(f"Gave up writing {name} after {MAX_WRITE_ATTEMPTS} conflicting attempts")
+
+    _write_current(release_configmap_name(release, namespace), current, seq)
+    return current
+
+
+def _write_current(name: str, current: dict, seq: int) -> None:
+    # Writers reach this in any order; the one whose event came later in the log wins.
+    data = {CURRENT_KEY: _dumps(current), SEQ_KEY: str(seq)}
+    for attempt in range(MAX_WRITE_ATTEMPTS):
+        cm = _read_release_cm(name)
+        if cm is not None and int((cm.data or {}).get(SEQ_KEY) or 0) >= seq:
+            return
+
+        rv = cm.metadata.resource_version if cm is not None else None
+        if _write_cm(cm, _configmap_body(name, _state_labels(current), data, rv)):
+            return
+        _backoff(attempt)
+
+    raise StateConflictError(f"Gave up writing {name} after {MAX_WRITE_ATTEMPTS} conflicting attempts")
+
+
+def _current_state(*, tool_key: str, namespace: str, release: str, chart: str | None, action: str, timestamp: str) -> dict:
+    return {
+        "toolKey": tool_key,
+        "namespace": namespace,
+        "chart": chart,
+        "release": release,
+        "lastAction": action,
+        "installed": action != "uninstall",
+        "timestamp": timestamp,
+    }
+
+
+def _write_release(*, tool_key: str, namespace: str, release: str, chart: str | None, action: str) -> dict:
+    def apply_events(events):
+        now = _now_iso()
+        current = _current_state(
+            tool_key=tool_key, namespace=namespace, release=release, chart=chart, action=action, timestamp=now
+        )
+        return current, _append_event(events, {"action": action, "chart": chart, "timestamp": now})
+
+    _ensure_migrated()
+    return _update_release(release, namespace, apply_events)
+
+
+def read_state() -> dict:
+    """
+    Returns:
+    {
+      "version": 2,
+      "updatedAt": "...",
+      "installs": [
+        {"toolKey": "...", "namespace": "...", "chart": "...", "release": "...", "lastAction": "...", "installed": true, "timestamp": "..."}
+      ]
+    }
+    """
+    return {"version": 2, "updatedAt": _now_iso(), "installs": list_releases()}
+
+
+def record_install(*, tool_key: str, namespace: str, chart: str, release: str) -> dict:
+    return _write_release(
+        tool_key=tool_key,
+        namespace=namespace,
+        release=release,
+        chart=chart,
+        action="install_or_upgrade",
+    )
+
+
+def record_uninstall(*, tool_key: str, namespace: str, release: str) -> dict:
+    return _write_release(
+        tool_key=tool_key,
+        namespace=namespace,
+        release=release,
+        chart=None,
+        action="uninstall",
+    )
+
+
+def migrate_legacy_state(*, delete: bool = True) -> int:
+    """
+    Fold the old append-only kubeyug-state ConfigMap into per-release state and event logs.
+    Returns the number of legacy events imported. Runs automatically on first state access
+    unless KUBEYUG_STATE_AUTO_MIGRATE=0.
+    """
+    global _LEGACY_CHECKED
+    _LEGACY_CHECKED = True
+    v1 = _core_v1()
+    try:
+        cm = v1.read_namespaced_config_map(LEGACY_STATE_CONFIGMAP_NAME, STATE_NAMESPACE)
+    except ApiException as e:
+        if e.status == 404:
+            return 0
+        raise
+
+    raw = (cm.data or {}).get(LEGACY_STATE_KEY) or "{}"
+    installs = json.loads(raw).get("installs", [])
+
+    by_release: dict[tuple[str, str], list[dict]] = {}
+    for ev in installs:
+        by_release.setdefault((ev.get("namespace"), ev.get("release")), []).append(ev)
+
+    # One write per release, however long its legacy history was.
+    for (namespace, release), legacy in by_release.items():
+        def apply_events(events, legacy=legacy, namespace=namespace, release=release):
+            # Legacy history goes first; anything already recorded per release is newer.
+            merged: list[dict] = []
+            for ev in legacy:
+                action = ev.get("lastAction") or "install_or_upgrade"
+                merged = _append_event(merged, {"action": action, "chart": ev.get("chart"), "timestamp": ev.get("timestamp")})
+            for ev in events:
+                merged = _append_event(merged, ev)
+            last = merged[-1]
+            current = _current_state(
+                tool_key=legacy[-1].get("toolKey"),
+                namespace=namespace,
+                release=release,
+                chart=last.get("chart"),
+                action=last.get("action"),
+                timestamp=last.get("timestamp") or _now_iso(),
+            )
+            return current, merged
+
+        _update_release(release, namespace, apply_events)
+
+    if delete:
+        try:
+            v1.delete_namespaced_config_map(LEGACY_STATE_CONFIGMAP_NAME, STATE_NAMESPACE)
+        except ApiException as e:
+            # Another kubeyug run migrated it at the same time.
+            if e.status != 404:
+                raise
+    return len(installs)
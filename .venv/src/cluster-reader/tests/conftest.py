@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+# Cache paths and the kubeconfig location are resolved at import time; keep both off the real ones.
+_SCRATCH = Path(tempfile.mkdtemp(prefix="kubeyug-tests-"))
+KUBECONFIG = _SCRATCH / "kubeconfig"
+os.environ["XDG_CACHE_HOME"] = str(_SCRATCH / "cache")
+os.environ["KUBECONFIG"] = str(KUBECONFIG)
+os.environ["KUBEYUG_REGISTRY_BACKGROUND_REFRESH"] = "0"
+os.environ.pop("KUBEYUG_REGISTRY_URL", None)
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """
+    benchmarks/fake_kube_api.py behind a generated kubeconfig; the shared clients are reset
+    so every test builds its own against this server.
+    """
+    pytest.importorskip("kubernetes")
+    from fake_kube_api import serve
+
+    server, state = serve(nodes=3)
+    KUBECONFIG.write_text(
+        json.dumps(
+            {
+                "apiVersion": "v1",
+                "kind": "Config",
+                "clusters": [{"name": "test", "cluster": {"server": f"http://127.0.0.1:{server.server_address[1]}"}}],
+                "users": [{"name": "test", "user": {"token": "test"}}],
+                "contexts": [{"name": "test", "context": {"cluster": "test", "user": "test"}}],
+                "current-context": "test",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    import agent
+    from kubeyug import kube, state as kube_state
+
+    for module in (agent, kube, kube_state):
+        monkeypatch.setattr(module, "_CORE_V1", None)
+    monkeypatch.setattr(kube_state, "_LEGACY_CHECKED", False)
+
+    yield state
+    server.shutdown()
+
+
+@pytest.fixture
+def fake_helm_bin(tmp_path, monkeypatch):
+    """
+    benchmarks/fake_helm.py as `helm` on PATH; returns its state directory.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    shim = bin_dir / "helm"
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{ROOT / "benchmarks" / "fake_helm.py"}" "$@"\n', encoding="utf-8")
+    shim.chmod(0o755)
+
+    state_dir = tmp_path / "helm"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("KUBEYUG_BENCH_HELM_STATE", str(state_dir))
+    return state_dir
@@ -0,0 +1,40 @@
+def test_bookmark_advances_resource_version(fake_api):
+    import agent
+
+    a = agent.NodeCapabilityAgent()
+    a.relist()
+    listed_rv = a._resource_version
+
+    # Quiet cluster: nothing changes, but other writes move the resourceVersion on.
+    with fake_api.lock:
+        for _ in range(5):
+            fake_api._next_rv()
+        current_rv = str(fake_api.resource_version)
+
+    a.watch_once()
+
+    assert current_rv != listed_rv
+    assert a._resource_version == current_rv
+    assert a.stats.writes == 3  # only the initial relist wrote
+
+
+def test_raw_dict_bookmark_event():
+    import agent
+
+    a = agent.NodeCapabilityAgent.__new__(agent.NodeCapabilityAgent)
+    a._resource_version = "5"
+    bookmark = {"kind": "Node", "apiVersion": "v1", "metadata": {"resourceVersion": "999"}}
+
+    a._handle_event({"type": "BOOKMARK", "object": bookmark, "raw_object": bookmark})
+
+    assert a._resource_version == "999"
+
+
+def test_relist_skips_unchanged_nodes(fake_api):
+    import agent
+
+    a = agent.NodeCapabilityAgent()
+    a.relist()
+    a.relist()
+
+    assert (a.stats.writes, a.stats.skips) == (3, 3)
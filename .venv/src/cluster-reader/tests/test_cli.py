@@ -0,0 +1,18 @@
+import importlib
+
+import pytest
+
+import cli
+
+
+@pytest.mark.parametrize("name", sorted(cli.COMMANDS))
+def test_every_lazy_command_registers(name):
+    module, register, _ = cli.COMMANDS[name]
+
+    assert callable(getattr(importlib.import_module(module), register))
+    cli.build_parser([name])
+
+
+def test_banner_command(capsys):
+    cli.main(["banner"])
+    assert "|" in capsys.readouterr().out
@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+
+def _install(context: str, release: str, namespace: str) -> None:
+    subprocess.run(
+        ["helm", "upgrade", "--install", release, f"repo/{release}", "-n", namespace, "--kube-context", context],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _kubeyug(*argv: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(ROOT / "cli.py"), *argv], capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("command", ["status", "history"])
+def test_release_missing_in_a_context_is_not_a_failure(fake_helm_bin, command):
+    _install("east", "cilium", "kube-system")
+
+    proc = _kubeyug(command, "cilium", "--contexts", "east,west", "--json")
+
+    assert proc.returncode == 0, proc.stderr
+    doc = json.loads(proc.stdout)
+    assert doc["contexts"]["east"]
+    assert doc["contexts"]["west"] is None
+    assert doc["errors"] == {}
+
+
+def test_not_installed_row_in_table(fake_helm_bin):
+    _install("east", "cilium", "kube-system")
+
+    proc = _kubeyug("status", "cilium", "--contexts", "east,west")
+
+    assert proc.returncode == 0, proc.stderr
+    west = next(line for line in proc.stdout.splitlines() if line.startswith("west"))
+    assert "not installed" in west
+
+
+def test_unreachable_context_is_still_an_error(fake_helm_bin, monkeypatch):
+    monkeypatch.setenv("KUBEYUG_BENCH_HELM_UNREACHABLE", "down")
+    _install("east", "cilium", "kube-system")
+
+    proc = _kubeyug("status", "cilium", "--contexts", "east,down", "--json")
+
+    assert proc.returncode == 1
+    assert "unreachable" in json.loads(proc.stdout)["errors"]["down"]
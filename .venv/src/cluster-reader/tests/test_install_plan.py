@@ -0,0 +1,90 @@
+import subprocess
+import time
+from argparse import Namespace
+
+import pytest
+
+from kubeyug import install_plan
+from kubeyug.install_plan import InstallPlan, PlannedRelease, execute_plan
+
+
+@pytest.fixture
+def fake_helm(monkeypatch):
+    """
+    Replace the helm calls execute_plan makes; releases listed in `failing` exit non-zero.
+    """
+    calls = {"upgrades": [], "failing": set()}
+
+    def upgrade(*, release, **kwargs):
+        calls["upgrades"].append(release)
+        time.sleep(calls.get("delay", 0))
+        if release in calls["failing"]:
+            raise subprocess.CalledProcessError(1, ["helm"], stderr=f"Error: {release} broke")
+
+    monkeypatch.setattr(install_plan, "helm_repo_add", lambda **kwargs: None)
+    monkeypatch.setattr(install_plan, "helm_repo_update", lambda names, **kwargs: None)
+    monkeypatch.setattr(install_plan, "helm_upgrade_install", upgrade)
+    return calls
+
+
+def _plan(*specs: tuple[str, list[str]]) -> InstallPlan:
+    releases = [PlannedRelease(key=k, tool={"helm_chart": f"repo/{k}"}, namespace="ns", depends_on=d) for k, d in specs]
+    return InstallPlan(releases=releases, repos={"repo": "https://example.invalid"})
+
+
+def test_on_success_error_keeps_release_ok_and_plan_running(fake_helm):
+    def record(release):
+        if release.key == "a":
+            raise RuntimeError("state store unreachable")
+
+    results = {r.key: r for r in execute_plan(_plan(("a", []), ("b", [])), jobs=1, on_success=record)}
+
+    assert results["a"].status == "ok"
+    assert "state store unreachable" in results["a"].error
+    assert results["b"].status == "ok" and results["b"].error is None
+
+
+def test_skip_propagates_to_dependents_listed_first(fake_helm):
+    fake_helm["failing"].add("a")
+    plan = _plan(("c", ["b"]), ("b", ["a"]), ("a", []))
+
+    results = {r.key: r for r in execute_plan(plan, jobs=4, fail_fast=False)}
+
+    assert results["a"].status == "failed"
+    assert (results["b"].status, results["b"].error) == ("skipped", "dependency failed")
+    assert (results["c"].status, results["c"].error) == ("skipped", "dependency failed")
+    assert fake_helm["upgrades"] == ["a"]
+
+
+def test_fail_fast_aborts_independent_releases(fake_helm):
+    fake_helm["failing"].add("a")
+
+    results = {r.key: r for r in execute_plan(_plan(("a", []), ("b", [])), jobs=1)}
+
+    assert results["a"].status == "failed"
+    assert (results["b"].status, results["b"].error) == ("skipped", "aborted (fail-fast)")
+
+
+def test_monitoring_goal_is_resolved_inside_multi_target_install(monkeypatch):
+    from kubeyug.commands import install
+
+    seen = {}
+    monkeypatch.setattr(install, "choose_monitoring_tool", lambda use_oumi: "prometheus")
+    monkeypatch.setattr(install, "install_many", lambda targets, **kwargs: seen.setdefault("targets", targets))
+
+    install.cmd_install(
+        Namespace(targets=["monitoring", "jaeger"], helm=False, oumi=False, namespace=None,
+                  dry_run=True, jobs=4, continue_on_error=False)
+    )
+
+    assert seen["targets"] == ["prometheus", "jaeger"]
+
+
+def test_failed_release_is_timed(fake_helm):
+    fake_helm["failing"].add("a")
+    fake_helm["delay"] = 0.05
+
+    (result,) = execute_plan(_plan(("a", [])), jobs=1)
+
+    assert result.status == "failed" and result.error == "Error: a broke"
+    assert result.seconds >= 0.05
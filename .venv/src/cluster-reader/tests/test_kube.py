@@ -0,0 +1,55 @@
+import pytest
+
+from kubeyug import kube
+
+
+@pytest.fixture
+def rollup_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(kube, "_ROLLUP_CACHE_PATH", tmp_path / "cluster_rollup.json")
+    monkeypatch.setattr(kube, "ROLLUP_MAX_AGE_SECONDS", 30.0)
+
+
+def test_rollup_is_reused_while_unrelated_writes_move_the_resource_version(fake_api, rollup_cache):
+    cold = kube.load_cluster_summary()
+    assert cold["nodes"] == 3
+
+    with fake_api.lock:
+        for _ in range(5):
+            fake_api._next_rv()  # lease / Event writes elsewhere in the cluster
+        before = fake_api.requests
+
+    assert kube.load_cluster_summary() == cold
+    assert fake_api.requests == before
+
+
+def test_rollup_expires_after_max_age(fake_api, rollup_cache, monkeypatch):
+    kube.load_cluster_summary()
+    monkeypatch.setattr(kube, "ROLLUP_MAX_AGE_SECONDS", 0.0)
+    before = fake_api.requests
+
+    assert kube.load_cluster_summary()["nodes"] == 3
+    assert fake_api.requests > before
+
+
+def _caps(name: str, cpu, memory) -> dict:
+    return {"nodeName": name, "arch": "amd64", "os": "linux", "capacity": {"cpu": cpu, "memory": memory}}
+
+
+def test_summary_parses_kubernetes_quantities():
+    summary = kube.summarize_cluster(
+        [
+            _caps("a", "3500m", "16Gi"),
+            _caps("b", "4", "16417924Ki"),
+            _caps("c", "1.5", None),
+        ]
+    )
+
+    assert summary["nodes"] == 3
+    assert summary["totalCpu"] == 9
+    assert summary["totalMemoryGi"] == round((16 * 2**30 + 16417924 * 2**10) / 2**30, 1) == 31.7
+
+
+def test_summary_skips_unparseable_quantities():
+    summary = kube.summarize_cluster([_caps("a", "lots", "16 gigs"), _caps("b", "500m", "")])
+
+    assert (summary["nodes"], summary["totalCpu"], summary["totalMemoryGi"]) == (2, 0.5, 0.0)
@@ -0,0 +1,101 @@
+import os
+import time
+
+import pytest
+
+from kubeyug.oumi import decision_cache
+from kubeyug.oumi.decision_cache import DecisionCache
+
+GOALS = {
+    "monitoring": [{"key": "prometheus", "category": "monitoring"}, {"key": "grafana", "category": "monitoring"}],
+    "logging": [{"key": "loki", "category": "logging"}],
+    "tracing": [{"key": "jaeger", "category": "tracing"}],
+}
+SUMMARY = {"nodes": 3, "arches": ["amd64"], "oses": ["linux"], "profile": "generic"}
+
+
+def _key(i: int) -> dict:
+    return {"id": f"k{i}"}
+
+
+def test_cache_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = DecisionCache(tmp_path, ttl_seconds=60, max_entries=10, enabled=True)
+    cache.put(_key(1), {"chartKey": "prometheus"})
+    assert cache.get(_key(1)) == {"chartKey": "prometheus"}
+
+    now = time.time()
+    monkeypatch.setattr(decision_cache.time, "time", lambda: now + 61)
+    assert cache.get(_key(1)) is None
+    assert not (tmp_path / "k1.json").exists()
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = DecisionCache(tmp_path, ttl_seconds=60, max_entries=2, enabled=True)
+    cache.put(_key(1), {"chartKey": "a"})
+    cache.put(_key(2), {"chartKey": "b"})
+    old = time.time() - 100
+    for i in (1, 2):
+        os.utime(tmp_path / f"k{i}.json", (old + i, old + i))
+
+    assert cache.get(_key(1)) is not None  # k1 is now the most recently used
+    cache.put(_key(3), {"chartKey": "c"})
+
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == ["k1.json", "k3.json"]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    pytest.importorskip("oumi")
+    import stub_openai_server
+
+    server, state = stub_openai_server.serve(port=0)
+    state.module = stub_openai_server
+    state.url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    yield state
+    server.shutdown()
+
+
+@pytest.fixture
+def client(stub, tmp_path):
+    from kubeyug.oumi.oumi_client import OumiClient, OumiClientConfig
+
+    cfg = OumiClientConfig(model="stub-model", base_url=stub.url, api_key="stub")
+    return OumiClient(cfg, cache=DecisionCache(tmp_path, ttl_seconds=3600, max_entries=16, enabled=True))
+
+
+def test_second_decide_is_a_cache_hit(client, stub):
+    first = client.decide("monitoring", SUMMARY, GOALS["monitoring"])
+    assert first["chartKey"] == "prometheus" and first["confidence"] > 0
+    assert stub.requests == 1
+
+    assert client.decide("monitoring", SUMMARY, GOALS["monitoring"]) == first
+    assert stub.requests == 1
+    assert (client.stats.cache_hits, client.stats.cache_misses, client.stats.infer_calls) == (1, 1, 1)
+
+
+def test_decide_many_sends_all_misses_in_one_infer_call(client, stub):
+    decisions = client.decide_many(SUMMARY, GOALS)
+
+    assert {g: d["chartKey"] for g, d in decisions.items()} == {
+        "monitoring": "prometheus",
+        "logging": "loki",
+        "tracing": "jaeger",
+    }
+    assert client.stats.infer_calls == 1
+    assert stub.requests == len(GOALS)  # one chat completion per conversation in the batch
+
+    client.decide_many(SUMMARY, GOALS)
+    assert client.stats.infer_calls == 1
+    assert stub.requests == len(GOALS)
+
+
+def test_fallback_decisions_are_not_cached(client, stub, monkeypatch):
+    monkeypatch.setattr(stub.module, "_choose", lambda prompt: {"chartKey": "not-a-tool", "confidence": 0.9})
+
+    for _ in range(2):
+        decision = client.decide("monitoring", SUMMARY, GOALS["monitoring"])
+        assert decision["confidence"] == 0.0
+
+    assert stub.requests == 2
+    assert client.stats.cache_hits == 0
+    assert not list(client.cache.directory.glob("*.json"))
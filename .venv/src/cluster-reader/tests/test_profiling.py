@@ -0,0 +1,61 @@
+import pytest
+
+from kubeyug import profiling
+
+
+@pytest.fixture
+def profiling_on(monkeypatch):
+    monkeypatch.setattr(profiling, "_enabled", True)
+    profiling.reset()
+    yield
+    profiling.reset()
+
+
+def test_span_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(profiling, "_enabled", False)
+    profiling.reset()
+    with profiling.span("x"):
+        pass
+    assert profiling.summary()["summary"] == {}
+
+
+def test_spans_are_capped_but_totals_keep_counting(profiling_on, monkeypatch):
+    monkeypatch.setattr(profiling, "MAX_SPANS", 5)
+    for _ in range(12):
+        with profiling.span("helm.list"):
+            pass
+
+    doc = profiling.summary()
+    assert len(doc["spans"]) == 5
+    assert doc["droppedSpans"] == 7
+    assert doc["summary"]["helm.list"]["count"] == 12
+
+
+def test_watch_through_instrumented_client_deserializes_events(fake_api, profiling_on):
+    from kubernetes import watch
+
+    import agent
+
+    v1 = agent._core_v1()
+    assert isinstance(v1, profiling._InstrumentedApi)
+
+    w = watch.Watch()
+    # Older clients return the model name, newer ones the model class.
+    return_type = w.get_return_type(v1.list_node)
+    assert getattr(return_type, "__name__", return_type) == "V1Node"
+
+    events = list(w.stream(v1.list_node, resource_version="0", timeout_seconds=5))
+    assert [e["type"] for e in events] == ["ADDED"] * 3
+    assert all(e["object"].metadata.name.startswith("node-") for e in events)
+    assert profiling.summary()["summary"]["k8s.list_node"]["count"] == 1
+
+
+def test_agent_watch_with_profiling_syncs_nodes(fake_api, profiling_on):
+    import agent
+
+    a = agent.NodeCapabilityAgent()
+    a._resource_version = "0"
+    a.watch_once()
+
+    assert a.stats.writes == 3
+    assert len(fake_api.configmaps) == 3
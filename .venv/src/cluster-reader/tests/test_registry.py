@@ -0,0 +1,111 @@
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import ROOT
+from kubeyug import registry
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    """
+    Point the registry cache at a temp dir and KUBEYUG_REGISTRY_URL at an unreachable endpoint.
+    """
+    cache = tmp_path / "cache"
+    for attr, name in [
+        ("_CACHE_DIR", ""),
+        ("_CACHE_REGISTRY_PATH", "tool_registry.json"),
+        ("_CACHE_META_PATH", "tool_registry.meta.json"),
+        ("_CACHE_INDEX_PATH", "tool_registry.index.pickle"),
+        ("_REFRESH_LOCK_PATH", "tool_registry.refresh.lock"),
+    ]:
+        monkeypatch.setattr(registry, attr, cache / name if name else cache)
+    monkeypatch.setattr(registry, "REGISTRY_URL", "http://127.0.0.1:9/registry.json")
+    monkeypatch.setattr(registry, "BACKGROUND_REFRESH", True)
+    return cache
+
+
+def test_failed_refresh_is_recorded_and_raised(remote):
+    with pytest.raises(registry.RegistryRefreshError):
+        registry.refresh_registry_cache()
+
+    meta = registry._CacheMeta.load(registry._CACHE_META_PATH)
+    assert meta.failures == 1
+    assert meta.fetched_at is None
+    assert time.time() - meta.last_attempt_at < 60
+    assert not registry._CACHE_REGISTRY_PATH.exists()
+
+
+def test_background_refresh_backs_off_after_a_failure(remote, monkeypatch):
+    spawned = []
+    monkeypatch.setattr(registry.subprocess, "Popen", lambda *a, **kw: spawned.append(a))
+
+    registry._CACHE_DIR.mkdir(parents=True)
+    registry._CacheMeta(last_attempt_at=time.time(), failures=1).save(registry._CACHE_META_PATH)
+    registry._schedule_background_refresh()
+    assert spawned == []
+
+    registry._CacheMeta(last_attempt_at=time.time() - 3600, failures=1).save(registry._CACHE_META_PATH)
+    registry._schedule_background_refresh()
+    assert len(spawned) == 1
+
+
+def test_background_refresher_does_not_inherit_profiling(remote, monkeypatch, tmp_path):
+    spawned = []
+    monkeypatch.setattr(registry.subprocess, "Popen", lambda *a, **kw: spawned.append(kw["env"]))
+    monkeypatch.setenv("KUBEYUG_PROFILE", "1")
+    monkeypatch.setenv("KUBEYUG_PROFILE_OUT", str(tmp_path / "trace.json"))
+
+    registry._schedule_background_refresh()
+
+    assert len(spawned) == 1
+    assert "KUBEYUG_PROFILE" not in spawned[0] and "KUBEYUG_PROFILE_OUT" not in spawned[0]
+
+
+def test_refresh_command_reports_unreachable_endpoint_in_one_line(tmp_path):
+    env = {
+        "PATH": "/usr/bin:/bin",
+        "XDG_CACHE_HOME": str(tmp_path),
+        "KUBEYUG_REGISTRY_URL": "http://127.0.0.1:9/registry.json",
+        "KUBEYUG_REGISTRY_BACKGROUND_REFRESH": "0",
+        "PYTHONPATH": ":".join(sys.path),
+    }
+    proc = subprocess.run([sys.executable, str(ROOT / "cli.py"), "registry", "refresh"], capture_output=True, text=True, env=env)
+
+    assert proc.returncode == 1
+    assert "Traceback" not in proc.stderr
+    assert proc.stderr.strip().startswith("Registry refresh failed: http://127.0.0.1:9/registry.json")
+    assert json.loads((tmp_path / "kubeyug" / "tool_registry.meta.json").read_text())["failures"] == 1
+
+
+_TOOL = {
+    "key": "prometheus",
+    "name": "Prometheus",
+    "helm_repo_name": "prometheus-community",
+    "helm_repo_url": "https://prometheus-community.github.io/helm-charts",
+    "helm_chart": "prometheus-community/prometheus",
+    "namespace": "monitoring",
+}
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        {"monitoring": ["prometheus"]},
+        {"monitoring": [_TOOL], "stacks": ["x"]},
+        {"monitoring": [_TOOL], "stacks": {"obs": "prometheus"}},
+        {"monitoring": [{**_TOOL, "depends_on": "cert-manager"}]},
+        {"monitoring": [{**_TOOL, "key": ["prometheus"]}]},
+    ],
+)
+def test_wrongly_shaped_registry_is_rejected(doc, remote, monkeypatch):
+    monkeypatch.setattr(registry, "_http_fetch_registry", lambda url, meta: (json.dumps(doc).encode("utf-8"), None))
+
+    with pytest.raises(registry.RegistryRefreshError, match="Invalid tool registry"):
+        registry.refresh_registry_cache()
+
+    assert registry._CacheMeta.load(registry._CACHE_META_PATH).failures == 1
+    assert not registry._CACHE_REGISTRY_PATH.exists()
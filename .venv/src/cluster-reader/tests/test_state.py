@@ -0,0 +1,94 @@
+import json
+import threading
+
+
+def _legacy_configmap(installs: list[dict]) -> dict:
+    return {
+        "metadata": {"name": "kubeyug-state", "namespace": "kubeyug", "resourceVersion": "1"},
+        "data": {"kubeyug-state.json": json.dumps({"installs": installs})},
+    }
+
+
+def test_concurrent_writes_to_one_release_are_not_lost(fake_api):
+    from kubeyug import state
+
+    threads = [
+        threading.Thread(
+            target=state.record_install,
+            kwargs=dict(tool_key="prometheus", namespace="monitoring", chart="prometheus-community/kube-prometheus-stack", release="prometheus"),
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    events = state.get_release_events("prometheus", "monitoring")
+    assert [(e["action"], e.get("count")) for e in events] == [("install_or_upgrade", 8)]
+
+
+def test_legacy_state_is_migrated_on_first_access(fake_api):
+    from kubeyug import state
+
+    legacy = [
+        {"toolKey": "cilium", "namespace": "kube-system", "release": "cilium", "chart": "cilium/cilium",
+         "lastAction": "install_or_upgrade", "timestamp": "2025-01-01T00:00:00+00:00"},
+        {"toolKey": "argo", "namespace": "argocd", "release": "argo", "chart": "argo/argo-cd",
+         "lastAction": "install_or_upgrade", "timestamp": "2025-01-02T00:00:00+00:00"},
+        {"toolKey": "argo", "namespace": "argocd", "release": "argo", "chart": None,
+         "lastAction": "uninstall", "timestamp": "2025-01-03T00:00:00+00:00"},
+    ]
+    fake_api.configmaps[("kubeyug", "kubeyug-state")] = _legacy_configmap(legacy)
+
+    tracked = {s["toolKey"]: s for s in state.list_releases()}
+
+    assert tracked["cilium"]["installed"] is True
+    assert tracked["argo"]["installed"] is False
+    assert ("kubeyug", "kubeyug-state") not in fake_api.configmaps
+    assert len(state.get_release_events("argo", "argocd")) == 2
+
+
+def test_migration_keeps_newer_per_release_state(fake_api, monkeypatch):
+    from kubeyug import state
+
+    monkeypatch.setattr(state, "AUTO_MIGRATE", False)
+    state.record_uninstall(tool_key="cilium", namespace="kube-system", release="cilium")
+    fake_api.configmaps[("kubeyug", "kubeyug-state")] = _legacy_configmap(
+        [{"toolKey": "cilium", "namespace": "kube-system", "release": "cilium", "chart": "cilium/cilium",
+          "lastAction": "install_or_upgrade", "timestamp": "2025-01-01T00:00:00+00:00"}]
+    )
+
+    assert state.migrate_legacy_state() == 1
+
+    current = state.get_release("cilium", "kube-system")
+    assert current["installed"] is False
+    assert [e["action"] for e in state.get_release_events("cilium", "kube-system")] == ["install_or_upgrade", "uninstall"]
+
+
+def test_current_state_is_stored_apart_from_the_event_log(fake_api):
+    from kubeyug import state
+
+    for _ in range(3):
+        state.record_install(tool_key="loki", namespace="logging", chart="grafana/loki", release="loki")
+    state.record_uninstall(tool_key="loki", namespace="logging", release="loki")
+
+    current_cm = fake_api.configmaps[("kubeyug", state.release_configmap_name("loki", "logging"))]
+    assert set(current_cm["data"]) == {"current.json", "seq"}
+    assert [s["lastAction"] for s in state.list_releases()] == ["uninstall"]
+    assert [e["action"] for e in state.get_release_events("loki", "logging")] == ["install_or_upgrade", "uninstall"]
+
+
+def test_an_older_write_does_not_overwrite_newer_current_state(fake_api):
+    from kubeyug import state
+
+    state.record_uninstall(tool_key="loki", namespace="logging", release="loki")
+    name = state.release_configmap_name("loki", "logging")
+    newer = state._current_state(
+        tool_key="loki", namespace="logging", release="loki", chart=None, action="uninstall", timestamp="later"
+    )
+    stale = dict(newer, lastAction="install_or_upgrade", installed=True)
+
+    state._write_current(name, stale, 0)
+
+    assert state.get_release("loki", "logging")["installed"] is False
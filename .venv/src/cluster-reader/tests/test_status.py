@@ -0,0 +1,42 @@
+import json
+from argparse import Namespace
+
+import pytest
+
+from kubeyug.commands import status
+
+
+@pytest.fixture
+def fleet(monkeypatch):
+    """
+    Two polls of `helm list`: prometheus moves from revision 1 to 2, then the watch is interrupted.
+    """
+    polls = [
+        [{"name": "prometheus", "namespace": "monitoring", "revision": "1", "status": "deployed", "chart": "prometheus-25.0.0"}],
+        [{"name": "prometheus", "namespace": "monitoring", "revision": "2", "status": "deployed", "chart": "prometheus-25.1.0"}],
+    ]
+
+    def sleep(_):
+        if not polls:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(status, "fetch_releases", lambda dry_run=False: polls.pop(0))
+    monkeypatch.setattr(status, "fetch_tracked_state", lambda: {})
+    monkeypatch.setattr(status, "_refresh_tracked", lambda tracked, changed: None)
+    monkeypatch.setattr(status.time, "sleep", sleep)
+
+
+def test_watch_json_is_one_object_per_line_from_the_start(fleet, capsys):
+    status._status_all(Namespace(dry_run=False, json=True, watch=True, interval=0))
+
+    lines = capsys.readouterr().out.splitlines()
+    rows = [json.loads(line) for line in lines]
+    prometheus = [r for r in rows if r["key"] == "prometheus"]
+    assert len(rows) > len(prometheus) == 2
+    assert [r["revision"] for r in prometheus] == ["1", "2"]
+
+
+def test_json_without_watch_is_one_array(fleet, capsys):
+    status._status_all(Namespace(dry_run=False, json=True, watch=False, interval=0))
+
+    assert isinstance(json.loads(capsys.readouterr().out), list)